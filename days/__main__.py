@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+import sys
+
+from typing import List, Tuple
+
+from days import benchmark, budget, cache, differential, generators, profiling, runner, suite
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m days', description='Advent of Code 2020 solutions.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='solve the puzzle input of a day')
+    run_parser.add_argument('day', type=int)
+    run_parser.add_argument('--part', type=int, choices=runner.PARTS, help='run only this part')
+    run_parser.add_argument('--input', dest='file_path', help='input file (default: days/inputs/dayNN.txt)')
+    run_parser.add_argument('--profile', choices=['cpu', 'mem'],
+                            help='run under cProfile or tracemalloc and write dayNN-partX.prof / .snapshot')
+    run_parser.add_argument('--profile-dir', default='.', help='directory for the profile files')
+    run_parser.add_argument('--top', type=int, default=20, help='amount of functions or allocation sites to show')
+    run_parser.add_argument('--no-cache', dest='cache', action='store_false', help='do not use the on-disk cache')
+
+    test_parser = commands.add_parser('test', help='run the example tests of the given days (default: all)')
+    test_parser.add_argument('days', type=int, nargs='*')
+
+    run_all_parser = commands.add_parser('run-all', help='solve all days in a process pool and report JSON timings')
+    run_all_parser.add_argument('--workers', type=int, help='number of worker processes (default: CPU count)')
+    run_all_parser.add_argument('--output', help='write the JSON report to this file instead of stdout')
+    run_all_parser.add_argument('--no-cache', dest='cache', action='store_false', help='do not use the on-disk cache')
+
+    generate_parser = commands.add_parser('generate', help='write synthetic inputs and reference answers')
+    generate_parser.add_argument('output_dir')
+    generate_parser.add_argument('days', type=int, nargs='*', help='days to generate (default: all)')
+    generate_parser.add_argument('--scale', type=int, default=1, help='input size relative to the puzzle input')
+    generate_parser.add_argument('--seed', type=int, default=generators.DEFAULT_SEED)
+    generate_parser.add_argument('--no-answers', dest='answers', action='store_false',
+                                 help='do not solve the generated inputs with the reference solvers')
+
+    benchmark_parser = commands.add_parser('benchmark', help='fit the scaling of solvers and compare to the baseline')
+    benchmark_parser.add_argument('targets', type=_target, nargs='*', metavar='DAY.PART',
+                                  help='parts to benchmark, e.g. 1.2 (default: %s)' % ' '.join(
+                                      '%d.%d' % target for target in benchmark.DEFAULT_TARGETS))
+    benchmark_parser.add_argument('--ladder', type=int, nargs='+', default=benchmark.DEFAULT_LADDER,
+                                  help='input scales to time')
+    benchmark_parser.add_argument('--repeat', type=int, default=3, help='best of N runs per scale')
+    benchmark_parser.add_argument('--tolerance', type=float, default=0.25,
+                                  help='allowed growth of the fitted exponent over the baseline')
+    benchmark_parser.add_argument('--update-baseline', action='store_true', help='store the results as the baseline')
+    benchmark_parser.add_argument('--compare', type=_check, nargs='+', metavar='CHECK',
+                                  help='time the reference and the fast engine of difftest checks instead')
+    benchmark_parser.add_argument('--scale', type=int, default=1, help='input scale of the --compare runs')
+
+    budget_parser = commands.add_parser('budget', help='check wall time and peak memory against the budgets')
+    budget_parser.add_argument('targets', type=_target, nargs='*', metavar='DAY.PART',
+                               help='parts to check, e.g. 15.2 (default: all)')
+    budget_parser.add_argument('--workers', type=int, default=1,
+                               help='number of worker processes (default: 1, parallel runs skew the wall time)')
+    budget_parser.add_argument('--update', action='store_true', help='store the measurements as the new budgets')
+    budget_parser.add_argument('--time-headroom', type=float, default=budget.TIME_HEADROOM,
+                               help='wall time budget as a multiple of the measurement when updating')
+    budget_parser.add_argument('--memory-headroom', type=float, default=budget.MEMORY_HEADROOM,
+                               help='peak memory budget as a multiple of the measurement when updating')
+
+    difftest_parser = commands.add_parser('difftest', help='compare the fast engines to the reference implementations')
+    difftest_parser.add_argument('checks', type=_check, nargs='*', metavar='CHECK',
+                                 help='checks to run, one of %s (default: all)' % ', '.join(
+                                     sorted(differential.CHECKS)))
+    difftest_parser.add_argument('--iterations', type=int, default=differential.DEFAULT_ITERATIONS,
+                                 help='random cases per check')
+    difftest_parser.add_argument('--seed', type=int, default=generators.DEFAULT_SEED)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        return _run(args)
+    if args.command == 'test':
+        return _test(args)
+    if args.command == 'run-all':
+        return _run_all(args)
+    if args.command == 'generate':
+        return _generate(args)
+    if args.command == 'benchmark':
+        return _benchmark(args)
+    if args.command == 'budget':
+        return _budget(args)
+    if args.command == 'difftest':
+        return _difftest(args)
+    return 1
+
+
+def _run(args: argparse.Namespace) -> int:
+    # A warm cache would have the profile show unpickling rather than the parser, so profiled runs skip it.
+    if args.cache and not args.profile:
+        cache.enable()
+
+    parts = [args.part] if args.part else runner.available_parts(args.day)
+    for part in parts:
+        if args.profile:
+            answer = _profile(args, part)
+        else:
+            answer = suite.measure_part(args.day, part, file_path=args.file_path).answer
+        print('Day %02d, part %d: %r' % (args.day, part, answer))
+    return 0
+
+
+def _profile(args: argparse.Namespace, part: int) -> object:
+    extension = 'prof' if args.profile == 'cpu' else 'snapshot'
+    output_path = os.path.join(args.profile_dir, f'day{args.day:02d}-part{part}.{extension}')
+    profile = profiling.profile_cpu if args.profile == 'cpu' else profiling.profile_memory
+
+    answer, summary = profile(args.day, part, output_path, file_path=args.file_path, top=args.top)
+    for line in summary:
+        print(line)
+    print(f'Profile written to {output_path}')
+
+    return answer
+
+
+def _test(args: argparse.Namespace) -> int:
+    for day in args.days or runner.DAYS:
+        runner.run_tests(day)
+        print('Day %02d: tests passed' % day)
+    return 0
+
+
+def _run_all(args: argparse.Namespace) -> int:
+    report = suite.run_all(workers=args.workers, cache_dir=cache.CACHE_DIR if args.cache else None)
+    report_json = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report_json + '\n')
+    else:
+        print(report_json)
+
+    return 1 if any(result['error'] for result in report['results']) else 0
+
+
+def _generate(args: argparse.Namespace) -> int:
+    answers = generators.write_inputs(args.output_dir, days=args.days, scale=args.scale, seed=args.seed,
+                                      answers=args.answers)
+    for day, parts in answers.items():
+        for part, answer in parts.items():
+            print('Day %s, part %s: %r' % (day, part, answer))
+    return 0
+
+
+def _benchmark(args: argparse.Namespace) -> int:
+    if args.compare:
+        comparisons = [benchmark.compare(name, args.scale, repeat=args.repeat) for name in args.compare]
+        for line in benchmark.format_comparisons(comparisons):
+            print(line)
+        return 0 if all(comparison.agree for comparison in comparisons) else 1
+
+    results = [benchmark.benchmark(day, part, ladder=args.ladder, repeat=args.repeat)
+               for day, part in args.targets or benchmark.DEFAULT_TARGETS]
+    baseline = benchmark.load_baseline()
+
+    for line in benchmark.format_report(results, baseline):
+        print(line)
+
+    regressions = benchmark.find_regressions(results, baseline, tolerance=args.tolerance)
+    for result, base in regressions:
+        print('Regression: day%02d.part%d scales as %s (exponent %.2f), baseline is %s (exponent %.2f)' % (
+            result.day, result.part, result.model, result.exponent, base['model'], base['exponent']))
+
+    if args.update_baseline:
+        benchmark.save_baseline(results)
+        return 0
+
+    return 1 if regressions else 0
+
+
+def _budget(args: argparse.Namespace) -> int:
+    # Budgets are checked on fresh runs, so neither of the caches is enabled.
+    results = suite.run_all(workers=args.workers, jobs=args.targets)['results']
+
+    if args.update:
+        budget.save_budgets(results, time_headroom=args.time_headroom, memory_headroom=args.memory_headroom)
+
+    budgets = budget.load_budgets()
+    for line in budget.format_diff(results, budgets):
+        print(line)
+
+    violations = budget.find_violations(results, budgets)
+    if violations:
+        print('%d of %d parts are over the budget' % (len(violations), len(results)))
+    return 1 if violations else 0
+
+
+def _difftest(args: argparse.Namespace) -> int:
+    mismatches = 0
+
+    for name in args.checks or sorted(differential.CHECKS):
+        mismatch = differential.run_check(name, iterations=args.iterations, seed=args.seed)
+        if not mismatch:
+            print('%s: %d cases agree' % (name, args.iterations))
+            continue
+
+        mismatches += 1
+        print('%s: mismatch on' % name)
+        for line in mismatch.case:
+            print('    ' + line)
+        print('  reference: %r' % (mismatch.expected,))
+        print('  fast:      %r' % (mismatch.actual,))
+
+    return 1 if mismatches else 0
+
+
+def _target(value: str) -> Tuple[int, int]:
+    try:
+        day, part = value.split('.')
+        return int(day), int(part)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'Expected DAY.PART, e.g. 1.2, got: {value}.')
+
+
+def _check(value: str) -> str:
+    if value not in differential.CHECKS:
+        checks = ', '.join(sorted(differential.CHECKS))
+        raise argparse.ArgumentTypeError(f'Unknown check: {value}. Expected one of {checks}.')
+    return value
+
+
+if __name__ == '__main__':
+    sys.exit(main())
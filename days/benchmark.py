@@ -0,0 +1,164 @@
+import json
+import math
+import os
+import platform
+import tempfile
+import time
+
+from collections import namedtuple
+from typing import Dict, List, Tuple
+
+from days import differential, generators, runner
+
+
+BenchmarkResult = namedtuple('BenchmarkResult', 'day part sizes times exponent model')
+Comparison = namedtuple('Comparison', 'check scale size reference fast agree')
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'benchmarks', 'baseline.json')
+DEFAULT_TARGETS = [(1, 2), (11, 1), (11, 2), (16, 2)]
+DEFAULT_LADDER = [1, 2, 4, 8]
+
+# Growth models ordered from the best to the worst scaling.
+MODELS = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log(n),
+    'n^2': lambda n: n * n,
+}
+
+
+def benchmark(day: int, part: int, ladder: List[int] = None, repeat: int = 3,
+              seed: int = generators.DEFAULT_SEED) -> BenchmarkResult:
+    module = runner.load_day(day)
+    solver = getattr(module, f'solve_part{part}')
+    sizes, times = [], []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in ladder if ladder else DEFAULT_LADDER:
+            file_path = os.path.join(tmp_dir, f'day{day:02d}-x{scale}.txt')
+            with open(file_path, 'w') as f:
+                f.write(generators.generate(day, scale=scale, seed=seed))
+
+            input_data = module.read_input(file_path)
+            best = math.inf
+            for _ in range(repeat):
+                start = time.perf_counter()
+                solver(input_data)
+                best = min(best, time.perf_counter() - start)
+
+            sizes.append(os.path.getsize(file_path))
+            times.append(best)
+
+    exponent, model = fit_complexity(sizes, times)
+    return BenchmarkResult(day, part, sizes, times, exponent, model)
+
+
+def compare(name: str, scale: int, repeat: int = 3, seed: int = generators.DEFAULT_SEED) -> Comparison:
+    # Times the reference and the fast engine of a difftest check on one generated input, e.g. the day04.passports
+    # check at scale 4000, about 10^6 passports, for the validator table against _validate.
+    check = differential.CHECKS[name]
+    module = runner.load_day(check.day)
+    data = generators.generate(check.day, scale=scale, seed=seed)
+    case = data.splitlines()
+    times, answers = [], []
+
+    for engine in (check.reference, check.fast):
+        best = math.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            answer = engine(module, case)
+            best = min(best, time.perf_counter() - start)
+        times.append(best)
+        answers.append(answer)
+
+    return Comparison(name, scale, len(data), times[0], times[1], answers[0] == answers[1])
+
+
+def format_comparisons(comparisons: List[Comparison]) -> List[str]:
+    lines = ['%-18s %-8s %-12s %-14s %-10s %-8s %s' % ('check', 'scale', 'size', 'reference, s', 'fast, s', 'speedup',
+                                                       'agree')]
+
+    for comparison in comparisons:
+        lines.append('%-18s %-8d %-12d %-14.4f %-10.4f %-8.2f %s' % (
+            comparison.check, comparison.scale, comparison.size, comparison.reference, comparison.fast,
+            comparison.reference / comparison.fast, 'yes' if comparison.agree else 'no'))
+
+    return lines
+
+
+def fit_complexity(sizes: List[int], times: List[float]) -> Tuple[float, str]:
+    # Inputs which do not grow with the scale (capped generators) give no curve to fit.
+    if len(set(sizes)) < 2:
+        return None, None
+
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    exponent = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum((x - x_mean) ** 2 for x in xs)
+
+    best_model, best_error = None, math.inf
+    for name, f in MODELS.items():
+        fs = [f(n) for n in sizes]
+        c = sum(t * v for t, v in zip(times, fs)) / sum(v * v for v in fs)
+        error = sum(((t - c * v) / t) ** 2 for t, v in zip(times, fs) if t > 0)
+        if error < best_error:
+            best_model, best_error = name, error
+
+    return exponent, best_model
+
+
+def load_baseline(file_path: str = BASELINE_PATH) -> Dict[str, Dict]:
+    if not os.path.exists(file_path):
+        return {}
+
+    with open(file_path, 'r') as f:
+        return json.load(f)['results']
+
+
+def save_baseline(results: List[BenchmarkResult], file_path: str = BASELINE_PATH) -> None:
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    baseline = load_baseline(file_path)
+    baseline.update({_key(result.day, result.part): _to_json(result) for result in results})
+
+    with open(file_path, 'w') as f:
+        json.dump({'python': platform.python_version(), 'results': dict(sorted(baseline.items()))}, f, indent=2)
+        f.write('\n')
+
+
+def find_regressions(results: List[BenchmarkResult], baseline: Dict[str, Dict],
+                     tolerance: float = 0.25) -> List[Tuple[BenchmarkResult, Dict]]:
+    regressions = []
+
+    # The best fitting model is noisy between close exponents, so only the exponent itself is compared.
+    for result in results:
+        base = baseline.get(_key(result.day, result.part))
+        if not base or result.exponent is None or base['exponent'] is None:
+            continue
+
+        if result.exponent > base['exponent'] + tolerance:
+            regressions.append((result, base))
+
+    return regressions
+
+
+def format_report(results: List[BenchmarkResult], baseline: Dict[str, Dict]) -> List[str]:
+    lines = ['%-12s %-12s %-10s %-10s %-10s %s' % ('target', 'largest n', 'time, s', 'exponent', 'model', 'baseline')]
+
+    for result in results:
+        base = baseline.get(_key(result.day, result.part))
+        base_repr = '%.2f %s' % (base['exponent'], base['model']) if base and base['exponent'] is not None else '-'
+        exponent_repr = '%.2f' % result.exponent if result.exponent is not None else '-'
+        lines.append('%-12s %-12d %-10.4f %-10s %-10s %s' % (
+            _key(result.day, result.part), result.sizes[-1], result.times[-1], exponent_repr, result.model or '-',
+            base_repr))
+
+    return lines
+
+
+def _key(day: int, part: int) -> str:
+    return f'day{day:02d}.part{part}'
+
+
+def _to_json(result: BenchmarkResult) -> Dict:
+    exponent = round(result.exponent, 3) if result.exponent is not None else None
+    return {'sizes': result.sizes, 'times': [round(t, 6) for t in result.times], 'exponent': exponent,
+            'model': result.model}
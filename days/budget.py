@@ -0,0 +1,96 @@
+import json
+import math
+import os
+import platform
+
+from typing import Dict, List
+
+
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), 'benchmarks', 'budgets.json')
+
+# Peak memory barely varies between runs, unlike the wall time, so its budget is kept tighter.
+TIME_HEADROOM = 2.0
+MEMORY_HEADROOM = 1.25
+
+# Floors keep the budgets of the fast parts above the timer noise and the interpreter's own memory.
+MIN_WALL_TIME = 0.1
+MIN_PEAK_RSS = 64 * 1024 * 1024
+
+
+def load_budgets(file_path: str = BUDGETS_PATH) -> Dict[str, Dict]:
+    if not os.path.exists(file_path):
+        return {}
+
+    with open(file_path, 'r') as f:
+        return json.load(f)['budgets']
+
+
+def save_budgets(results: List[Dict], time_headroom: float = TIME_HEADROOM, memory_headroom: float = MEMORY_HEADROOM,
+                 file_path: str = BUDGETS_PATH) -> None:
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    budgets = load_budgets(file_path)
+
+    for result in results:
+        if result['error']:
+            continue
+
+        budgets[_key(result['day'], result['part'])] = {
+            'wall_time': round(max(result['wall_time'] * time_headroom, MIN_WALL_TIME), 1),
+            'peak_rss': max(_round_mb(result['peak_rss'] * memory_headroom), MIN_PEAK_RSS),
+        }
+
+    with open(file_path, 'w') as f:
+        json.dump({'python': platform.python_version(), 'budgets': dict(sorted(budgets.items()))}, f, indent=2)
+        f.write('\n')
+
+
+def find_violations(results: List[Dict], budgets: Dict[str, Dict]) -> List[Dict]:
+    violations = []
+
+    for result in results:
+        budget = budgets.get(_key(result['day'], result['part']))
+        if result['error']:
+            violations.append(result)
+        elif budget and (result['wall_time'] > budget['wall_time'] or result['peak_rss'] > budget['peak_rss']):
+            violations.append(result)
+
+    return violations
+
+
+def format_diff(results: List[Dict], budgets: Dict[str, Dict]) -> List[str]:
+    lines = ['%-12s %-10s %-10s %-8s %-10s %-10s %-8s %s' % (
+        'target', 'time, s', 'budget', 'diff', 'peak, MB', 'budget', 'diff', 'status')]
+
+    for result in results:
+        key = _key(result['day'], result['part'])
+        budget = budgets.get(key)
+
+        if result['error']:
+            lines.append('%-12s %s' % (key, result['error']))
+            continue
+        if not budget:
+            lines.append('%-12s %-10.3f %-10s %-8s %-10.1f %-10s %-8s %s' % (
+                key, result['wall_time'], '-', '-', result['peak_rss'] / 2 ** 20, '-', '-', 'no budget'))
+            continue
+
+        over_time = result['wall_time'] > budget['wall_time']
+        over_memory = result['peak_rss'] > budget['peak_rss']
+        status = ', '.join(name for name, over in (('time', over_time), ('memory', over_memory)) if over)
+        lines.append('%-12s %-10.3f %-10.1f %-8s %-10.1f %-10.1f %-8s %s' % (
+            key, result['wall_time'], budget['wall_time'], _diff(result['wall_time'], budget['wall_time']),
+            result['peak_rss'] / 2 ** 20, budget['peak_rss'] / 2 ** 20, _diff(result['peak_rss'], budget['peak_rss']),
+            'over ' + status if status else 'ok'))
+
+    return lines
+
+
+def _key(day: int, part: int) -> str:
+    return f'day{day:02d}.part{part}'
+
+
+def _diff(actual: float, budget: float) -> str:
+    return '%+.0f%%' % ((actual / budget - 1) * 100)
+
+
+def _round_mb(size: float) -> int:
+    return math.ceil(size / 2 ** 20) * 2 ** 20
@@ -0,0 +1,131 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
+
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache')
+
+RESULTS_MAX_BYTES = 1024 * 1024
+
+_parsed_dir = None
+_results_dir = None
+_parsed = {}
+
+
+def enable(cache_dir: str = CACHE_DIR) -> None:
+    global _parsed_dir, _results_dir
+    _parsed_dir = os.path.join(cache_dir, 'parsed')
+    _results_dir = os.path.join(cache_dir, 'results')
+    os.makedirs(_parsed_dir, exist_ok=True)
+    os.makedirs(_results_dir, exist_ok=True)
+
+
+def disable() -> None:
+    global _parsed_dir, _results_dir
+    _parsed_dir = None
+    _results_dir = None
+    _parsed.clear()
+
+
+def results_enabled() -> bool:
+    return _results_dir is not None
+
+
+def result_key(day: int, part: int, input_path: str, solver_paths: List[str]) -> str:
+    digest = hashlib.sha256(f'day{day:02d}.part{part}'.encode())
+    for file_path in [input_path] + solver_paths:
+        file_digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                file_digest.update(chunk)
+        digest.update(file_digest.digest())
+
+    return digest.hexdigest()
+
+
+def load_result(key: str) -> Optional[Dict]:
+    if _results_dir is None:
+        return None
+
+    file_path = os.path.join(_results_dir, f'{key}.json')
+    try:
+        with open(file_path, 'r') as f:
+            result = json.load(f)
+        # Reads refresh the modification time, so eviction drops the least recently used results first.
+        os.utime(file_path)
+        return result
+    except FileNotFoundError:
+        return None
+
+
+def store_result(key: str, result: Dict, max_bytes: int = RESULTS_MAX_BYTES) -> None:
+    if _results_dir is None:
+        return
+
+    _write_atomic(os.path.join(_results_dir, f'{key}.json'), json.dumps(result).encode())
+    _evict(_results_dir, max_bytes)
+
+
+def install(module: ModuleType) -> None:
+    # Day modules list their expensive parsers with a version in CACHED_PARSERS; bumping the version invalidates
+    # the stored results after the parser changes.
+    for name, version in getattr(module, 'CACHED_PARSERS', {}).items():
+        parser = getattr(module, name)
+        if not hasattr(parser, '__wrapped__'):
+            setattr(module, name, _cached(parser, version))
+
+
+def _cached(parser: Callable, version: int) -> Callable:
+    @functools.wraps(parser)
+    def wrapper(*args, **kwargs):
+        if _parsed_dir is None:
+            return parser(*args, **kwargs)
+
+        key = pickle.dumps((parser.__module__, parser.__qualname__, version, args, sorted(kwargs.items())))
+        digest = hashlib.sha256(key).hexdigest()
+
+        if digest not in _parsed:
+            file_path = os.path.join(_parsed_dir, f'{digest}.pickle')
+            if os.path.exists(file_path):
+                with open(file_path, 'rb') as f:
+                    _parsed[digest] = f.read()
+            else:
+                _parsed[digest] = pickle.dumps(parser(*args, **kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+                _write_atomic(file_path, _parsed[digest])
+
+        # Parts are free to mutate what they get, so every call unpickles its own copy.
+        return pickle.loads(_parsed[digest])
+
+    return wrapper
+
+
+def _write_atomic(file_path: str, data: bytes) -> None:
+    tmp_path = f'{file_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+
+
+def _evict(directory: str, max_bytes: int) -> None:
+    entries = []
+    for entry in os.scandir(directory):
+        try:
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except FileNotFoundError:
+            continue
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, file_path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+        total -= size
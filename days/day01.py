@@ -1,36 +1,180 @@
 import itertools
 import os
-from typing import List
 
+from collections import Counter, defaultdict
+from typing import Iterable, List, Optional, Tuple
+
+
+# Parts which take a single pass over the input, with the reader the runner may stream them from.
+STREAMED_PARTS = {1: 'ints'}
 
-def part1(nums: List[int]) -> int:
-    s = set(nums)
-    for num in nums:
-        if 2020 - num in s:
-            return num * (2020 - num)
-    return -1
+
+def part1(nums: Iterable[int]) -> int:
+    pair = find_pair(nums, 2020)
+    return pair[0] * pair[1] if pair else -1
 
 
 def part2(nums: List[int]) -> int:
-    s = set(nums)
-    combs = itertools.combinations(nums, 2)
-    for a, b in combs:
-        if 2020 - a - b in s:
-            return a * b * (2020 - a - b)
-    return -1
+    solutions = find_k_sum(nums, 3, 2020, first=True)
+    if not solutions:
+        return -1
+
+    a, b, c = solutions[0]
+    return a * b * c
+
+
+def find_pair(nums: Iterable[int], target: int) -> Optional[Tuple[int, int]]:
+    # One pass which stops at the first match, so the numbers after it are never read.
+    seen = set()
+    for num in nums:
+        if target - num in seen:
+            return target - num, num
+        seen.add(num)
+    return None
+
+
+def find_k_sum(nums: Iterable[int], k: int, target: int, first: bool = False) -> List[Tuple[int, ...]]:
+    if k < 1:
+        raise ValueError(f'Expected k of at least 1, got: {k}.')
+
+    values = _candidates(nums, k, target)
+
+    if k == 1:
+        solutions = [(value,) for value in values if value == target]
+    elif k == 2:
+        solutions = _two_sum(values, target, first)
+    elif k == 3:
+        solutions = _three_sum(values, target, first)
+    else:
+        solutions = _meet_in_the_middle(values, k, target, first)
+
+    return solutions[:1] if first else solutions
+
+
+def _candidates(nums: Iterable[int], k: int, target: int) -> List[int]:
+    # A value can be used at most k times in a solution and, when nothing is negative, never exceeds the target.
+    # Bounded values then keep the candidates few however long the report is.
+    counts = Counter(nums)
+    non_negative = not counts or min(counts) >= 0
+    return sorted(value for value, count in counts.items() for _ in range(min(count, k))
+                  if not non_negative or value <= target)
+
+
+def _two_sum(values: List[int], target: int, first: bool) -> List[Tuple[int, ...]]:
+    counts = Counter(values)
+    solutions = []
+
+    for value in sorted(counts):
+        complement = target - value
+        if complement < value:
+            break
+        if complement > value and complement in counts or complement == value and counts[value] > 1:
+            solutions.append((value, complement))
+            if first:
+                break
+
+    return solutions
+
+
+def _three_sum(values: List[int], target: int, first: bool) -> List[Tuple[int, ...]]:
+    solutions = []
+
+    for i in range(len(values) - 2):
+        if values[i] + values[i + 1] + values[i + 2] > target:
+            break
+        if i > 0 and values[i] == values[i - 1]:
+            continue
+
+        lo, hi = i + 1, len(values) - 1
+        while lo < hi:
+            s = values[i] + values[lo] + values[hi]
+            if s < target:
+                lo += 1
+            elif s > target:
+                hi -= 1
+            else:
+                solutions.append((values[i], values[lo], values[hi]))
+                if first:
+                    return solutions
+                lo += 1
+                while lo < hi and values[lo] == values[lo - 1]:
+                    lo += 1
+
+    return solutions
+
+
+def _meet_in_the_middle(values: List[int], k: int, target: int, first: bool) -> List[Tuple[int, ...]]:
+    counts = Counter(values)
+    distinct = sorted(counts)
+
+    # Every solution, sorted, splits into its k // 2 lowest values and the rest, so each one is built exactly once.
+    low = k // 2
+    halves = defaultdict(list)
+    for combination in _multisets(distinct, counts, low):
+        halves[sum(combination)].append(combination)
+
+    solutions = []
+    for combination in _multisets(distinct, counts, k - low):
+        for other in halves.get(target - sum(combination), []):
+            if other[-1] > combination[0]:
+                continue
+            if other[-1] == combination[0] and not _fits(other + combination, counts):
+                continue
+
+            solutions.append(other + combination)
+            if first:
+                return solutions
+
+    return sorted(solutions)
+
+
+def _multisets(distinct: List[int], counts: Counter, size: int) -> Iterable[Tuple[int, ...]]:
+    for combination in itertools.combinations_with_replacement(distinct, size):
+        if len(set(combination)) == size or _fits(combination, counts):
+            yield combination
+
+
+def _fits(combination: Tuple[int, ...], counts: Counter) -> bool:
+    return all(counts[value] >= n for value, n in Counter(combination).items())
 
 
 def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(514579, part1([1721, 979, 366, 299, 675, 1456]))
-test(241861950, part2([1721, 979, 366, 299, 675, 1456]))
+def run_tests() -> None:
+    test(514579, part1([1721, 979, 366, 299, 675, 1456]))
+    test(241861950, part2([1721, 979, 366, 299, 675, 1456]))
+
+    test((1721, 299), find_pair(iter([1721, 979, 366, 299, 675, 1456]), 2020))
+    test((1009, 1011), find_pair(itertools.count(1000), 2020))
+    test(None, find_pair([1010, 5], 2020))
+
+    test([(299, 1721)], find_k_sum([1721, 979, 366, 299, 675, 1456], 2, 2020))
+    test([(366, 675, 979)], find_k_sum([1721, 979, 366, 299, 675, 1456], 3, 2020))
+    test([(1, 1, 2, 3), (1, 2, 2, 2)], find_k_sum([2, 1, 3, 2, 1, 2, 2, 9], 4, 7))
+    test([(-3, 1, 2, 7)], find_k_sum([7, -3, 2, 1, 8], 4, 7, first=True))
+    test([(1010, 1010)], find_k_sum([1010, 5, 1010], 2, 2020))
+    test([], find_k_sum([1010, 5], 2, 2020))
+
+
+def read_input(file_path: str = None) -> List[int]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day01.txt')
+    with open(file_path, 'r') as f:
+        return [int(line.strip()) for line in f.readlines()]
+
+
+def solve_part1(input_data: Iterable[int]) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: List[int]) -> int:
+    return part2(input_data)
 
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day01.txt')
-with open(file_path, 'r') as f:
-    input_data = [int(line.strip()) for line in f.readlines()]
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 01, part 1: %r' % (part1(input_data)))
-    print('Day 01, part 2: %r' % (part2(input_data)))
+    input_data = read_input()
+    print('Day 01, part 1: %r' % (solve_part1(input_data)))
+    print('Day 01, part 2: %r' % (solve_part2(input_data)))
@@ -1,14 +1,79 @@
+import itertools
 import os
 import re
 
+from array import array
 from collections import namedtuple
-from typing import List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    from days import reader
+except ImportError:
+    # Run as a script from the days directory.
+    import reader
 
 
 Rule = namedtuple('Rule', 'min max symbol')
 
+# Columns of a parsed batch: rule bounds and symbols, and the offsets of each password within the joined passwords.
+Columns = namedtuple('Columns', 'mins maxs symbols starts ends data')
+
+# Lines parsed into columns at a time when a part streams its input.
+BATCH_LINES = 64 * 1024
+
+# Parts which take a single pass over the input, with the reader the runner may stream them from.
+STREAMED_PARTS = {1: 'lines'}
+
+# Part 2 parses the whole input into a PasswordDB, which is cached with the parsed inputs of the runner.
+CACHED_PARSERS = {'_load_db': 1}
+
+
+class PasswordDB:
+    def __init__(self, passwords_with_rules: Iterable[str]):
+        self._columns = _parse_columns('\n'.join(passwords_with_rules).encode())
+        self._policies = {'occurrences': occurrences_policy, 'positions': positions_policy}
+
+    def __len__(self) -> int:
+        return len(self._columns.mins)
+
+    def register(self, name: str, policy: Callable[[Rule, str], bool]) -> None:
+        self._policies[name] = policy
+
+    def count(self) -> Dict[str, int]:
+        columns = self._columns
+        # The puzzle policies have column engines, only the other ones are evaluated password by password.
+        counts = {name: COLUMN_COUNTERS[policy](columns) if policy in COLUMN_COUNTERS else 0
+                  for name, policy in self._policies.items()}
+        policies = [(name, policy) for name, policy in self._policies.items() if policy not in COLUMN_COUNTERS]
+        if not policies:
+            return counts
+
+        # Passwords are ASCII, so the byte offsets index the decoded buffer as well.
+        passwords = columns.data.decode()
+        for lo, hi, symbol, start, end in zip(columns.mins, columns.maxs, columns.symbols, columns.starts,
+                                              columns.ends):
+            rule = Rule(lo, hi, chr(symbol))
+            password = passwords[start:end]
+            for name, policy in policies:
+                if policy(rule, password):
+                    counts[name] += 1
+
+        return counts
+
+
+def occurrences_policy(rule: Rule, password: str) -> bool:
+    return rule.min <= password.count(rule.symbol) <= rule.max
 
-def part1(passwords_with_rules: List[str]) -> int:
+
+def positions_policy(rule: Rule, password: str) -> bool:
+    n = len(password)
+    pos1 = rule.min <= n and password[rule.min - 1] == rule.symbol
+    pos2 = rule.max <= n and password[rule.max - 1] == rule.symbol
+    return pos1 != pos2
+
+
+# Per-password parts kept as the reference for PasswordDB and count_valid.
+def part1(passwords_with_rules: Iterable[str]) -> int:
     pwrs = _parse_passwords(passwords_with_rules)
     valid = 0
 
@@ -32,39 +97,134 @@ def part2(passwords_with_rules: List[str]) -> int:
     return valid
 
 
-def _parse_passwords(passwords_with_rules: List[str]) -> List[Tuple[Rule, str]]:
-    parsed_passwords = []
-
+def _parse_passwords(passwords_with_rules: Iterable[str]) -> Iterator[Tuple[Rule, str]]:
     for pwr in passwords_with_rules:
         min_, max_, symbol, password = re.findall(r'(\d+)-(\d+) ([a-z]): ([a-z]+)', pwr)[0]
         rule = Rule(int(min_), int(max_), symbol)
-        parsed_passwords.append((rule, password))
+        yield rule, password
+
+
+def count_occurrences(passwords_with_rules: Iterable[str], batch_lines: int = BATCH_LINES) -> int:
+    # Lines are parsed into columns a batch at a time, so the memory is bounded by the batch on inputs of any size.
+    lines = iter(passwords_with_rules)
+    valid = 0
+
+    for batch in iter(lambda: list(itertools.islice(lines, batch_lines)), []):
+        valid += _count_by_occurrences(_parse_columns('\n'.join(batch).encode()))
+
+    return valid
+
+
+def count_valid(file_path: str, workers: int = None, chunk_size: int = reader.CHUNK_SIZE) -> Tuple[int, int]:
+    counts = reader.map_chunks(_count_chunk, file_path, b'\n', chunk_size, workers)
+    return sum(c for c, _ in counts), sum(c for _, c in counts)
 
-    return parsed_passwords
+
+def _count_chunk(data: bytes) -> Tuple[int, int]:
+    columns = _parse_columns(data)
+    return _count_by_occurrences(columns), _count_by_positions(columns)
+
+
+def _load_db(passwords_with_rules: List[str]) -> PasswordDB:
+    return PasswordDB(passwords_with_rules)
+
+
+def _parse_columns(data: bytes) -> Columns:
+    # Every line splits into three tokens, '1-3', 'a:' and the password, so each column is a slice of the tokens and
+    # the parsing stays in C. The passwords are joined into one buffer addressed by offsets.
+    tokens = data.split()
+    if len(tokens) % 3:
+        raise ValueError(f'Expected lines like "1-3 a: abcde", got {len(tokens)} tokens.')
+
+    bounds = b' '.join(tokens[0::3]).replace(b'-', b' ').split()
+    passwords = tokens[2::3]
+    ends = array('Q', itertools.accumulate(map(len, passwords)))
+    starts = array('Q', [0]) + ends[:-1]
+
+    return Columns(array('I', map(int, bounds[0::2])), array('I', map(int, bounds[1::2])),
+                   b''.join(tokens[1::3])[0::2], starts, ends, b''.join(passwords))
+
+
+def _count_by_occurrences(columns: Columns) -> int:
+    # bytes.count over the password slices runs in C for the whole column.
+    counts = map(columns.data.count, columns.symbols, columns.starts, columns.ends)
+    return sum(map(lambda lo, hi, count: lo <= count <= hi, columns.mins, columns.maxs, counts))
+
+
+def _count_by_positions(columns: Columns) -> int:
+    data = columns.data
+
+    def valid(lo: int, hi: int, symbol: int, start: int, end: int) -> bool:
+        n = end - start
+        return (lo <= n and data[start + lo - 1] == symbol) != (hi <= n and data[start + hi - 1] == symbol)
+
+    return sum(map(valid, columns.mins, columns.maxs, columns.symbols, columns.starts, columns.ends))
+
+
+COLUMN_COUNTERS = {occurrences_policy: _count_by_occurrences, positions_policy: _count_by_positions}
 
 
 def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(2, part1([
-    '1-3 a: abcde',
-    '1-3 b: cdefg',
-    '2-9 c: ccccccccc',
-]))
+def run_tests() -> None:
+    test(2, part1([
+        '1-3 a: abcde',
+        '1-3 b: cdefg',
+        '2-9 c: ccccccccc',
+    ]))
+
+    test(1, part2([
+        '1-3 a: abcde',
+        '1-3 b: cdefg',
+        '2-9 c: ccccccccc',
+    ]))
+
+    list(_parse_passwords(['12-3 b: cdefg']))
+
+    db = PasswordDB([
+        '1-3 a: abcde',
+        '1-3 b: cdefg',
+        '2-9 c: ccccccccc',
+    ])
+    db.register('no repeats', lambda rule, password: len(set(password)) == len(password))
+    test({'occurrences': 2, 'positions': 1, 'no repeats': 2}, db.count())
+
+    columns = _parse_columns(b'1-3 a: abcde\n1-3 b: cdefg\n2-9 c: ccccccccc\n')
+    test(2, _count_by_occurrences(columns))
+    test(1, _count_by_positions(columns))
+
+    test(2, count_occurrences(iter([
+        '1-3 a: abcde',
+        '1-3 b: cdefg',
+        '2-9 c: ccccccccc',
+    ]), batch_lines=2))
+
+    # Small chunks of the puzzle input go through the chunk bounds and the process pool.
+    file_path = os.path.join(os.path.dirname(__file__), 'inputs/day02.txt')
+    input_data = read_input(file_path)
+    test((part1(input_data), part2(input_data)), count_valid(file_path, workers=2, chunk_size=4096))
+    test(part1(input_data), count_occurrences(reader.lines(file_path), batch_lines=100))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day02.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: Iterable[str]) -> int:
+    return count_occurrences(input_data)
 
-test(1, part2([
-    '1-3 a: abcde',
-    '1-3 b: cdefg',
-    '2-9 c: ccccccccc',
-]))
 
+def solve_part2(input_data: List[str]) -> int:
+    return _load_db(input_data).count()['positions']
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day02.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
 
-    print('Day 02, part 1: %r' % (part1(input_data)))
-    print('Day 02, part 2: %r' % (part2(input_data)))
+if __name__ == '__main__':
+    run_tests()
 
-_parse_passwords(['12-3 b: cdefg'])
+    input_data = read_input()
+    print('Day 02, part 1: %r' % (solve_part1(input_data)))
+    print('Day 02, part 2: %r' % (solve_part2(input_data)))
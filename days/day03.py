@@ -1,26 +1,88 @@
+import math
 import os
 
 from collections import namedtuple
+from itertools import repeat
 from typing import List
 
 
 SlopeRule = namedtuple('SlopeRule', 'right down')
 
+TREE_BITS = str.maketrans('#.', '10')
+
 
 class TreeGrid:
     def __init__(self, tree_map: List[str]):
-        self._grid = tree_map
+        # Bit x of a row is set when there is a tree in column x. The map is reversed and translated as a whole, which
+        # reverses every row in place and the order of the rows.
+        lines = '\n'.join(tree_map)[::-1].translate(TREE_BITS).split('\n')[::-1]
+        self._rows = [int(line, 2) if line else 0 for line in lines] if tree_map else []
+        self._width = len(tree_map[0]) if tree_map else 0
+        self._residue_counts = {}
+        self._walked_steps = {}
 
     @property
     def height(self) -> int:
-        return len(self._grid)
+        return len(self._rows)
+
+    @property
+    def width(self) -> int:
+        return self._width
 
     def get(self, x: int, y: int) -> str:
         if y >= self.height:
             raise ValueError(f'Out of bound. y: {y}, height: {self.height}.')
 
-        width = len(self._grid[0])
-        return self._grid[y][x % width]
+        return '#' if self._rows[y] >> (x % self._width) & 1 else '.'
+
+    def count_trees(self, rules: List[SlopeRule]) -> List[int]:
+        counts = []
+
+        # The k-th step of a slope visits column k * right % width, which repeats with the period
+        # width / gcd(right, width). All the steps with k % period == r visit the same column, so a slope is the sum of
+        # one column count per residue, read from an index shared by every slope with the same down and period.
+        # The index costs about period * width operations to build, so slopes are walked until the steps walked for
+        # its down and period outweigh that, and only then is it built.
+        for rule in rules:
+            if not self._width:
+                counts.append(0)
+                continue
+
+            period = self._width // math.gcd(rule.right, self._width)
+            key = (rule.down, period)
+            if key not in self._residue_counts:
+                self._walked_steps[key] = self._walked_steps.get(key, 0) + (self.height + rule.down - 1) // rule.down
+                if self._walked_steps[key] <= period * self._width:
+                    counts.append(self._walk(rule))
+                    continue
+
+            residue_counts = self._index(rule.down, period)
+            counts.append(sum(residue_counts[r][r * rule.right % self._width] for r in range(period)))
+
+        return counts
+
+    def _walk(self, rule: SlopeRule) -> int:
+        right, width = rule.right, self._width
+        return sum(row >> (k * right % width) & 1 for k, row in enumerate(self._rows[::rule.down]))
+
+    def _index(self, down: int, period: int) -> List[List[int]]:
+        # Each index holds period * width counts, up to width ** 2 for a period of the full width, so it outgrows the
+        # map itself on wide maps with few rows.
+        key = (down, period)
+        if key not in self._residue_counts:
+            self._residue_counts[key] = [_column_counts(self._rows[r * down::period * down], self._width)
+                                         for r in range(period)]
+
+        return self._residue_counts[key]
+
+
+def _column_counts(rows: List[int], width: int) -> List[int]:
+    # The rows are packed into one int, a field of whole bytes per row, so the trees of a column are the popcount of
+    # the packed rows under a mask with bit x set in every field: one pass over the rows and a C-level AND per column.
+    size = (width + 7) // 8
+    packed = int.from_bytes(b''.join(map(int.to_bytes, rows, repeat(size), repeat('little'))), 'little')
+    ones = int.from_bytes((b'\x01' + bytes(size - 1)) * len(rows), 'little')
+    return [(packed & ones << x).bit_count() for x in range(width)]
 
 
 def part1(tree_map: List[str], rule: SlopeRule) -> int:
@@ -31,12 +93,17 @@ def part1(tree_map: List[str], rule: SlopeRule) -> int:
 def part2(tree_map: List[str], rules: List[SlopeRule]) -> int:
     grid = TreeGrid(tree_map)
     result = 1
-    for rule in rules:
-        result *= _calculate(grid, rule)
+    for count in grid.count_trees(rules):
+        result *= count
     return result
 
 
 def _calculate(grid: TreeGrid, rule: SlopeRule) -> int:
+    return grid.count_trees([rule])[0]
+
+
+# Walking the slope one cell at a time is the reference for TreeGrid.count_trees.
+def _walk_slope(grid: TreeGrid, rule: SlopeRule) -> int:
     trees_count = 0
     x, y = 0, 0
 
@@ -53,51 +120,65 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(7, part1([
-    '..##.......',
-    '#...#...#..',
-    '.#....#..#.',
-    '..#.#...#.#',
-    '.#...##..#.',
-    '..#.##.....',
-    '.#.#.#....#',
-    '.#........#',
-    '#.##...#...',
-    '#...##....#',
-    '.#..#...#.#',
-], rule=SlopeRule(3, 1)))
-
-
-test(336, part2([
-    '..##.......',
-    '#...#...#..',
-    '.#....#..#.',
-    '..#.#...#.#',
-    '.#...##..#.',
-    '..#.##.....',
-    '.#.#.#....#',
-    '.#........#',
-    '#.##...#...',
-    '#...##....#',
-    '.#..#...#.#',
-], rules=[
-    SlopeRule(1, 1),
-    SlopeRule(3, 1),
-    SlopeRule(5, 1),
-    SlopeRule(7, 1),
-    SlopeRule(1, 2),
-]))
-
-
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day03.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
-
-    print('Day 03, part 1: %r' % (part1(input_data, rule=SlopeRule(3, 1))))
-    print('Day 03, part 2: %r' % (part2(input_data, rules=[
+def run_tests() -> None:
+    test(7, part1([
+        '..##.......',
+        '#...#...#..',
+        '.#....#..#.',
+        '..#.#...#.#',
+        '.#...##..#.',
+        '..#.##.....',
+        '.#.#.#....#',
+        '.#........#',
+        '#.##...#...',
+        '#...##....#',
+        '.#..#...#.#',
+    ], rule=SlopeRule(3, 1)))
+
+    test(336, part2([
+        '..##.......',
+        '#...#...#..',
+        '.#....#..#.',
+        '..#.#...#.#',
+        '.#...##..#.',
+        '..#.##.....',
+        '.#.#.#....#',
+        '.#........#',
+        '#.##...#...',
+        '#...##....#',
+        '.#..#...#.#',
+    ], rules=[
         SlopeRule(1, 1),
         SlopeRule(3, 1),
         SlopeRule(5, 1),
         SlopeRule(7, 1),
         SlopeRule(1, 2),
-    ])))
+    ]))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day03.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1(input_data, rule=SlopeRule(3, 1))
+
+
+def solve_part2(input_data: List[str]) -> int:
+    return part2(input_data, rules=[
+        SlopeRule(1, 1),
+        SlopeRule(3, 1),
+        SlopeRule(5, 1),
+        SlopeRule(7, 1),
+        SlopeRule(1, 2),
+    ])
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 03, part 1: %r' % (solve_part1(input_data)))
+    print('Day 03, part 2: %r' % (solve_part2(input_data)))
@@ -1,8 +1,42 @@
+import json
 import os
 import re
 
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Tuple
+
+try:
+    from days import reader
+except ImportError:
+    # Run as a script from the days directory.
+    import reader
+
+
+# Field schema in the format of the JSON config accepted by load_schema. Each rule is one of the types:
+# range (a number of `digits` between `min` and `max`), units (a number followed by one of the `units`, each with its
+# own bounds), pattern (a regular expression matching the whole value), choice (one of the `values`) and any. Fields
+# with `required` set must be present in a passport.
+DEFAULT_SCHEMA = {
+    'byr': {'type': 'range', 'digits': 4, 'min': 1920, 'max': 2002, 'required': True},
+    'iyr': {'type': 'range', 'digits': 4, 'min': 2010, 'max': 2020, 'required': True},
+    'eyr': {'type': 'range', 'digits': 4, 'min': 2020, 'max': 2030, 'required': True},
+    'hgt': {'type': 'units', 'units': {'cm': [150, 193], 'in': [59, 76]}, 'required': True},
+    'hcl': {'type': 'pattern', 'pattern': '#[0-9a-f]{6}', 'required': True},
+    'ecl': {'type': 'choice', 'values': ['amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth'], 'required': True},
+    'pid': {'type': 'pattern', 'pattern': '[0-9]{9}', 'required': True},
+    'cid': {'type': 'any'},
+}
+
 
 def part1(passport_data: str) -> int:
+    return count_passports(_read_passports(reader.split_records(passport_data.splitlines())))[0]
+
+
+def part2(passport_data: str) -> int:
+    return count_passports(_read_passports(reader.split_records(passport_data.splitlines())))[1]
+
+
+# The regex and _validate counts are the reference for count_passports.
+def _count_present(passport_data: str) -> int:
     passports = [p.replace('\n', ' ') for p in passport_data.split('\n\n')]
     required_fields = {'byr', 'iyr', 'eyr', 'hgt', 'hcl', 'ecl', 'pid'}
     valid = 0
@@ -15,7 +49,7 @@ def part1(passport_data: str) -> int:
     return valid
 
 
-def part2(passport_data: str) -> int:
+def _count_valid(passport_data: str) -> int:
     passports = [p.replace('\n', ' ') for p in passport_data.split('\n\n')]
     required_fields = {'byr', 'iyr', 'eyr', 'hgt', 'hcl', 'ecl', 'pid'}
     valid = 0
@@ -36,6 +70,112 @@ def part2(passport_data: str) -> int:
     return valid
 
 
+def count_passports(passports: Iterable[Dict[str, str]], validators: Dict[str, Callable[[str], bool]] = None,
+                    required: FrozenSet[str] = None) -> Tuple[int, int]:
+    validators = validators if validators else VALIDATORS
+    required = required if required is not None else REQUIRED_FIELDS
+    present, valid = 0, 0
+
+    for passport in passports:
+        if required.issubset(passport):
+            present += 1
+            # Fields missing from the schema are not valid.
+            for field, value in passport.items():
+                if not validators.get(field, _reject)(value):
+                    break
+            else:
+                valid += 1
+
+    return present, valid
+
+
+def load_schema(file_path: str) -> Dict[str, Dict]:
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def compile_validators(schema: Dict[str, Dict] = None) -> Dict[str, Callable[[str], bool]]:
+    schema = schema if schema else DEFAULT_SCHEMA
+    return {field: _compile_rule(field, rule) for field, rule in schema.items()}
+
+
+def required_fields(schema: Dict[str, Dict] = None) -> FrozenSet[str]:
+    schema = schema if schema else DEFAULT_SCHEMA
+    return frozenset(field for field, rule in schema.items() if rule.get('required'))
+
+
+def _compile_rule(field: str, rule: Dict) -> Callable[[str], bool]:
+    kind = rule.get('type')
+
+    if kind == 'range':
+        digits, lo, hi = rule.get('digits'), rule['min'], rule['max']
+
+        def valid_range(value: str) -> bool:
+            try:
+                return (digits is None or len(value) == digits) and lo <= int(value) <= hi
+            except ValueError:
+                return False
+
+        return valid_range
+
+    if kind == 'units':
+        units = {unit: tuple(bounds) for unit, bounds in rule['units'].items()}
+        lengths = sorted({len(unit) for unit in units}, reverse=True)
+
+        def valid_units(value: str) -> bool:
+            for n in lengths:
+                bounds = units.get(value[-n:])
+                if bounds and len(value) > n:
+                    try:
+                        return bounds[0] <= int(value[:-n]) <= bounds[1]
+                    except ValueError:
+                        return False
+            return False
+
+        return valid_units
+
+    if kind == 'pattern':
+        match = re.compile(rule['pattern']).fullmatch
+        return lambda value: match(value) is not None
+
+    if kind == 'choice':
+        return frozenset(rule['values']).__contains__
+
+    if kind == 'any':
+        return lambda value: True
+
+    raise ValueError(f'Unknown validator type for {field}: {kind}.')
+
+
+def _reject(value: str) -> bool:
+    return False
+
+
+# Validators and required fields of the default schema, compiled once.
+VALIDATORS = compile_validators()
+REQUIRED_FIELDS = required_fields()
+
+
+def count_passports_file(file_path: str, workers: int = None, chunk_size: int = reader.CHUNK_SIZE,
+                         schema: Dict[str, Dict] = None) -> Tuple[int, int]:
+    # Chunks end on a blank line, so no passport is split.
+    counts = reader.map_chunks(_count_chunk, file_path, b'\n\n', chunk_size, workers, (schema,))
+    return sum(c for c, _ in counts), sum(c for _, c in counts)
+
+
+def _count_chunk(data: bytes, schema: Dict[str, Dict] = None) -> Tuple[int, int]:
+    # Compiled validators can not be sent to the workers, so each chunk compiles the schema itself.
+    validators = compile_validators(schema) if schema else VALIDATORS
+    required = required_fields(schema) if schema else REQUIRED_FIELDS
+    records = reader.split_records(data.decode().splitlines())
+    return count_passports(_read_passports(records), validators, required)
+
+
+def _read_passports(records: Iterable[List[str]]) -> Iterator[Dict[str, str]]:
+    for record in records:
+        yield dict(field.partition(':')[::2] for line in record for field in line.split())
+
+
 def _validate(field: str, value: str) -> bool:
     if field == 'byr':
         return len(value) == 4 and 1920 <= int(value) <= 2002
@@ -67,7 +207,8 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(2, part1("""
+def run_tests() -> None:
+    test(2, part1("""
 ecl:gry pid:860033327 eyr:2020 hcl:#fffffd
 byr:1937 iyr:2017 cid:147 hgt:183cm
 
@@ -83,7 +224,7 @@ hcl:#cfa07d eyr:2025 pid:166559648
 iyr:2011 ecl:brn hgt:59in
 """))
 
-test(4, part2("""
+    test(4, part2("""
 eyr:1972 cid:100
 hcl:#18171d ecl:amb hgt:170 pid:186cm iyr:2018 byr:1926
 
@@ -112,10 +253,65 @@ eyr:2022
 iyr:2010 hgt:158cm hcl:#b6652a ecl:blu byr:1944 eyr:2021 pid:093154719
 """))
 
+    test(True, VALIDATORS['byr']('2002'))
+    test(False, VALIDATORS['byr']('2003'))
+    test(True, VALIDATORS['hgt']('60in'))
+    test(True, VALIDATORS['hgt']('190cm'))
+    test(False, VALIDATORS['hgt']('190in'))
+    test(False, VALIDATORS['hgt']('190'))
+    test(True, VALIDATORS['hcl']('#123abc'))
+    test(False, VALIDATORS['hcl']('#123abz'))
+    test(False, VALIDATORS['hcl']('123abc'))
+    test(True, VALIDATORS['ecl']('brn'))
+    test(False, VALIDATORS['ecl']('wat'))
+    test(True, VALIDATORS['pid']('000000001'))
+    test(False, VALIDATORS['pid']('0123456789'))
+
+    custom = compile_validators(dict(DEFAULT_SCHEMA, hgt={'type': 'units', 'units': {'mm': [1500, 1930]}}))
+    test(True, custom['hgt']('1700mm'))
+    test(False, custom['hgt']('170cm'))
+
+    schema = dict(DEFAULT_SCHEMA, pid={'type': 'any'}, cid={'type': 'any', 'required': True})
+    test(frozenset(['byr', 'iyr', 'eyr', 'hgt', 'hcl', 'ecl', 'cid']), required_fields(schema))
+    test((1, 1), count_passports([{'byr': '1980', 'iyr': '2012', 'eyr': '2030', 'hgt': '74in', 'hcl': '#623a2f',
+                                   'ecl': 'grn', 'cid': '1'}], compile_validators(schema), required_fields(schema)))
+
+    test((2, 1), count_passports(_read_passports(reader.split_records("""
+pid:087499704 hgt:74in ecl:grn iyr:2012 eyr:2030 byr:1980
+hcl:#623a2f
+
+eyr:1972 cid:100
+hcl:#18171d ecl:amb hgt:170 pid:186cm iyr:2018 byr:1926
+
+hcl:#cfa07d eyr:2025 pid:166559648
+iyr:2011 ecl:brn hgt:59in
+""".splitlines()))))
+
+    # Small chunks of the puzzle input go through the chunk bounds and the process pool.
+    file_path = os.path.join(os.path.dirname(__file__), 'inputs/day04.txt')
+    input_data = read_input(file_path)
+    test((part1(input_data), part2(input_data)), count_passports_file(file_path, workers=2, chunk_size=2048))
+    test((part1(input_data), part2(input_data)), count_passports_file(file_path, workers=1, chunk_size=1,
+                                                                      schema=DEFAULT_SCHEMA))
+
+
+def read_input(file_path: str = None) -> str:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day04.txt')
+    with open(file_path, 'r') as f:
+        return f.read()
+
+
+def solve_part1(input_data: str) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: str) -> int:
+    return part2(input_data)
+
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day04.txt')
-with open(file_path, 'r') as f:
-    input_data = f.read()
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 04, part 1: %r' % (part1(input_data)))
-    print('Day 04, part 2: %r' % (part2(input_data)))
+    input_data = read_input()
+    print('Day 04, part 1: %r' % (solve_part1(input_data)))
+    print('Day 04, part 2: %r' % (solve_part2(input_data)))
@@ -1,34 +1,91 @@
 import os
-from typing import List, Tuple
 
+from array import array
+from itertools import repeat
+from typing import Iterable, List, Optional, Tuple
 
-def part1(seats: List[str]) -> int:
-    best_seat_id = 0
 
-    for seat in seats:
-        row, column = _calculate_seat(seat)
-        seat_id = row * 8 + column
-        if seat_id > best_seat_id:
-            best_seat_id = seat_id
+# Parts which take a single pass over the input, with the reader the runner may stream them from.
+STREAMED_PARTS = {1: 'lines', 2: 'lines'}
 
-    return best_seat_id
+# A boarding pass is its seat id in binary, with F and L for 0 and B and R for 1.
+SEAT_BITS = str.maketrans('FBLR', '0101')
+SEAT_BYTES = bytes.maketrans(b'FBLR', b'0101')
 
 
-def part2(seats: List[str]) -> int:
-    ids = []
-    for seat in seats:
-        row, column = _calculate_seat(seat)
-        seat_id = row * 8 + column
-        ids.append(seat_id)
+def part1(seats: Iterable[str]) -> int:
+    return max(map(seat_id, seats), default=0)
 
-    min_ = min(ids)
-    max_ = max(ids)
-    known_seats = set(ids)
-    all_seats = set(range(min_, max_ + 1))
 
-    return list(all_seats - known_seats)[0]
+def part2(seats: Iterable[str]) -> int:
+    return find_missing_seat(map(seat_id, seats))
 
 
+def find_missing_seat(ids: Iterable[int], bits: int = 10) -> int:
+    # XOR of all the ids between the lowest and the highest one cancels out every known id but the missing one. The
+    # ids are marked in the bitmap of find_missing_seats in the same pass, so repeated passes, which break the XOR,
+    # fall back to the lowest gap of the bitmap without reading the ids again.
+    bitmap, lowest, highest, xor, count, repeated = _mark_seats(ids, bits)
+
+    if lowest is None:
+        raise ValueError('No boarding passes.')
+    if not repeated and count == highest - lowest:
+        return xor ^ _xor_range(lowest) ^ _xor_range(highest + 1)
+
+    gaps = _gaps(bitmap, lowest, highest)
+    if not gaps:
+        raise ValueError(f'No missing seat between {lowest} and {highest}.')
+
+    return gaps[0]
+
+
+def find_missing_seats(ids: Iterable[int], bits: int = 10) -> List[int]:
+    bitmap, lowest, highest, *_ = _mark_seats(ids, bits)
+    return _gaps(bitmap, lowest, highest) if lowest is not None else []
+
+
+def _mark_seats(ids: Iterable[int], bits: int) -> Tuple[bytearray, Optional[int], Optional[int], int, int, bool]:
+    # A bitmap of every possible seat id, 128 bytes for 10-bit ids, finds any number of gaps in one pass.
+    bitmap = bytearray(((1 << bits) + 7) // 8)
+    lowest, highest, xor, count, repeated = None, None, 0, 0, False
+
+    for id_ in ids:
+        if not 0 <= id_ < 1 << bits:
+            raise ValueError(f'Seat id {id_} does not fit in {bits} bits.')
+        mask = 1 << (id_ & 7)
+        if bitmap[id_ >> 3] & mask:
+            repeated = True
+        bitmap[id_ >> 3] |= mask
+        if lowest is None or id_ < lowest:
+            lowest = id_
+        if highest is None or id_ > highest:
+            highest = id_
+        xor ^= id_
+        count += 1
+
+    return bitmap, lowest, highest, xor, count, repeated
+
+
+def _gaps(bitmap: bytearray, lowest: int, highest: int) -> List[int]:
+    return [id_ for id_ in range(lowest, highest + 1) if not bitmap[id_ >> 3] >> (id_ & 7) & 1]
+
+
+def _xor_range(n: int) -> int:
+    # XOR of 0..n - 1.
+    return [0, n - 1, 1, n][n % 4]
+
+
+def seat_id(seat: str) -> int:
+    return int(seat.translate(SEAT_BITS), 2)
+
+
+def decode_seats(data: bytes) -> array:
+    # The whole manifest is translated at once and every pass is parsed by int in C.
+    passes = data.translate(SEAT_BYTES).split()
+    return array('I', map(int, passes, repeat(2)))
+
+
+# Binary search over the rows and columns is the reference for seat_id.
 def _calculate_seat(seat: str) -> Tuple[int, int]:
     row = _binary_search(seat[:7])
     column = _binary_search(seat[7:])
@@ -53,22 +110,61 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test((44, 5), _calculate_seat('FBFBBFFRLR'))
-test((70, 7), _calculate_seat('BFFFBBFRRR'))
-test((14, 7), _calculate_seat('FFFBBBFRRR'))
-test((102, 4), _calculate_seat('BBFFBBFRLL'))
+def run_tests() -> None:
+    test((44, 5), _calculate_seat('FBFBBFFRLR'))
+    test((70, 7), _calculate_seat('BFFFBBFRRR'))
+    test((14, 7), _calculate_seat('FFFBBBFRRR'))
+    test((102, 4), _calculate_seat('BBFFBBFRLL'))
+
+    test(357, seat_id('FBFBBFFRLR'))
+    test(567, seat_id('BFFFBBFRRR'))
+    test([357, 567, 119, 820], list(decode_seats(b'FBFBBFFRLR\nBFFFBBFRRR\nFFFBBBFRRR\nBBFFBBFRLL\n')))
+
+    test(5, find_missing_seat([8, 3, 7, 4, 6]))
+    test(12, find_missing_seat([10, 11, 13]))
+    test(5, find_missing_seat([3, 4, 4, 6]))
+    test(2, find_missing_seat([1, 1, 1, 4]))
+    test(4, find_missing_seat([3, 3, 6]))
+    test([5], find_missing_seats([8, 3, 7, 4, 6]))
+    test([4, 6, 9], find_missing_seats([3, 5, 7, 8, 10]))
+
+    test(820, part1([
+        'FBFBBFFRLR',
+        'BFFFBBFRRR',
+        'FFFBBBFRRR',
+        'BBFFBBFRLL',
+    ]))
+
+    test(359, part2(iter([
+        'FBFBBFFRLR',
+        'FBFBBFFRRL',
+        'FBFBBFFRRL',
+        'FBFBBBFLLL',
+    ])))
+    try:
+        find_missing_seat([2000, 2001, 2003, 2003])
+        test('ValueError', None)
+    except ValueError:
+        test(2002, find_missing_seat([2000, 2001, 2003, 2003], bits=11))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day05.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: Iterable[str]) -> int:
+    return part1(input_data)
+
 
-test(820, part1([
-    'FBFBBFFRLR',
-    'BFFFBBFRRR',
-    'FFFBBBFRRR',
-    'BBFFBBFRLL',
-]))
+def solve_part2(input_data: Iterable[str]) -> int:
+    return part2(input_data)
 
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day05.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 05, part 1: %r' % (part1(input_data)))
-    print('Day 05, part 2: %r' % (part2(input_data)))
+    input_data = read_input()
+    print('Day 05, part 1: %r' % (solve_part1(input_data)))
+    print('Day 05, part 2: %r' % (solve_part2(input_data)))
@@ -1,9 +1,62 @@
+import math
+import operator
 import os
+import string
 
-from typing import List
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from functools import reduce
+from typing import Iterable, Iterator, List, Tuple
+
+try:
+    from days import reader
+except ImportError:
+    # Run as a script from the days directory.
+    import reader
+
+
+# Answers of a person are a 26-bit mask with bit i set for the i-th question.
+QUESTION_BITS = {question: 1 << i for i, question in enumerate(string.ascii_lowercase)}
+
+
+class AnswerHistograms:
+    def __init__(self, groups: Iterable[List[str]]):
+        # Counts of the answered questions of every group, sorted within the group and stored back to back, so a
+        # threshold query is one binary search per group.
+        self._counts = array('I')
+        self._offsets = array('Q', [0])
+        self._sizes = array('I')
+
+        for group in groups:
+            self._counts.extend(sorted(Counter(''.join(group)).values()))
+            self._offsets.append(len(self._counts))
+            self._sizes.append(len(group))
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def at_least(self, k: int) -> int:
+        k = max(k, 1)
+        counts, offsets = self._counts, self._offsets
+        return sum(hi - bisect_left(counts, k, lo, hi) for lo, hi in zip(offsets, offsets[1:]))
+
+    def at_least_share(self, percent: float) -> int:
+        counts, offsets = self._counts, self._offsets
+        return sum(hi - bisect_left(counts, max(math.ceil(percent * size / 100), 1), lo, hi)
+                   for lo, hi, size in zip(offsets, offsets[1:], self._sizes))
 
 
 def part1(form_data: str) -> int:
+    return count_answers(_read_groups(reader.split_records(form_data.splitlines())))[0]
+
+
+def part2(form_data: str) -> int:
+    return count_answers(_read_groups(reader.split_records(form_data.splitlines())))[1]
+
+
+# The set counts are the reference for count_answers.
+def _count_anyone(form_data: str) -> int:
     groups = _parse_form_data(form_data)
     answer_count = 0
 
@@ -14,7 +67,7 @@ def part1(form_data: str) -> int:
     return answer_count
 
 
-def part2(form_data: str) -> int:
+def _count_everyone(form_data: str) -> int:
     groups = _parse_form_data(form_data)
     answer_count = 0
 
@@ -29,6 +82,43 @@ def part2(form_data: str) -> int:
     return answer_count
 
 
+def count_answers(groups: Iterable[List[int]], k: int = 1) -> Tuple[int, int, int]:
+    if k < 1:
+        raise ValueError(f'Expected k of at least 1, got: {k}.')
+
+    anyone, everyone, at_least = 0, 0, 0
+
+    for masks in groups:
+        anyone += reduce(operator.or_, masks).bit_count()
+        everyone += reduce(operator.and_, masks).bit_count()
+        at_least += _answered_by(masks, k).bit_count()
+
+    return anyone, everyone, at_least
+
+
+def count_answers_file(file_path: str, k: int = 1) -> Tuple[int, int, int]:
+    return count_answers(_read_groups(reader.records(file_path)), k)
+
+
+def read_histograms(file_path: str) -> AnswerHistograms:
+    return AnswerHistograms(reader.records(file_path))
+
+
+def _answered_by(masks: List[int], k: int) -> int:
+    # levels[j] has the questions answered by more than j of the members seen so far.
+    levels = [0] * k
+    for mask in masks:
+        for j in range(k - 1, 0, -1):
+            levels[j] |= levels[j - 1] & mask
+        levels[0] |= mask
+    return levels[-1]
+
+
+def _read_groups(groups: Iterable[List[str]]) -> Iterator[List[int]]:
+    for group in groups:
+        yield [reduce(operator.or_, map(QUESTION_BITS.__getitem__, answers), 0) for answers in group]
+
+
 def _parse_form_data(form_data: str) -> List[List[str]]:
     forms = form_data.split('\n\n')
     groups = []
@@ -44,7 +134,8 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(11, part1("""
+def run_tests() -> None:
+    test(11, part1("""
 abc
 
 a
@@ -62,7 +153,7 @@ a
 b
 """))
 
-test(6, part2("""
+    test(6, part2("""
 abc
 
 a
@@ -80,10 +171,41 @@ a
 b
 """))
 
+    groups = [['abc'], ['a', 'b', 'c'], ['ab', 'ac'], ['a', 'a', 'a', 'a'], ['b']]
+    test((11, 6, 2), count_answers(_read_groups(groups), k=2))
+    test((3, 0, 2), count_answers(_read_groups([['ab', 'bc', 'a']]), k=2))
+
+    histograms = AnswerHistograms(groups)
+    test(5, len(histograms))
+    test(11, histograms.at_least(1))
+    test(2, histograms.at_least(2))
+    test(6, histograms.at_least_share(100))
+    test(8, histograms.at_least_share(50))
+
+    file_path = os.path.join(os.path.dirname(__file__), 'inputs/day06.txt')
+    input_data = read_input(file_path)
+    test((part1(input_data), part2(input_data)), count_answers_file(file_path)[:2])
+    histograms = read_histograms(file_path)
+    test((part1(input_data), part2(input_data)), (histograms.at_least(1), histograms.at_least_share(100)))
+
+
+def read_input(file_path: str = None) -> str:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day06.txt')
+    with open(file_path, 'r') as f:
+        return f.read()
+
+
+def solve_part1(input_data: str) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: str) -> int:
+    return part2(input_data)
+
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day06.txt')
-with open(file_path, 'r') as f:
-    input_data = f.read()
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 06, part 1: %r' % (part1(input_data)))
-    print('Day 06, part 2: %r' % (part2(input_data)))
+    input_data = read_input()
+    print('Day 06, part 1: %r' % (solve_part1(input_data)))
+    print('Day 06, part 2: %r' % (solve_part2(input_data)))
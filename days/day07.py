@@ -1,9 +1,10 @@
+import heapq
 import os
 import re
 
 
-from collections import namedtuple
-from typing import List, Dict, Set
+from collections import deque, namedtuple
+from typing import Dict, Iterator, List, Set, Tuple
 
 
 BagRule = namedtuple('BagRule', 'amount name')
@@ -19,16 +20,229 @@ class BagRuleNode:
         return f'Color: {self.color}, outer: {self.outer}, inner: {self.inner}'
 
 
+class BagIndex:
+    def __init__(self, grid: Dict[str, BagRuleNode]):
+        self._ids, self._ancestors = _ancestor_bitsets(grid)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def containers(self, color: str) -> int:
+        return self._ancestors[self._ids[color]].bit_count()
+
+    def can_contain(self, outer_color: str, inner_color: str) -> bool:
+        return bool(self._ancestors[self._ids[inner_color]] >> self._ids[outer_color] & 1)
+
+
+class BagGraph:
+    def __init__(self, bag_rules: List[str] = None):
+        # The initial rules are counted in one pass over the whole graph, only later edits are incremental. Colors keep
+        # the ids of the index, new ones take the lowest id freed by a dropped color or are numbered after them.
+        bag_rules = bag_rules if bag_rules else []
+        self._grid = _parse_rules(bag_rules)
+        self._rules = {_parse_rule(line)[0] for line in bag_rules}
+        self._ids, ancestors = _ancestor_bitsets(self._grid)
+        self._colors = sorted(self._ids, key=self._ids.get)
+        self._free_ids = []
+        self._counts = inner_bag_counts(self._grid)
+        self._ancestors = {color: ancestors[i] for color, i in self._ids.items()}
+
+    def __len__(self) -> int:
+        return len(self._grid)
+
+    def __contains__(self, color: str) -> bool:
+        return color in self._grid
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._grid)
+
+    def contents(self, color: str) -> int:
+        return self._counts[color]
+
+    def containers(self, color: str) -> int:
+        return self._ancestors[color].bit_count()
+
+    def can_contain(self, outer_color: str, inner_color: str) -> bool:
+        return bool(self._ancestors[inner_color] >> self._ids[outer_color] & 1)
+
+    def set_rule(self, line: str) -> None:
+        color, inner = _parse_rule(line)
+        old_inner = self._replace(color, inner)
+        self._rules.add(color)
+        self._drop_orphans(old_inner)
+
+    def remove_rule(self, color: str) -> None:
+        if color not in self._rules:
+            raise KeyError(color)
+
+        old_inner = self._replace(color, [])
+        self._rules.remove(color)
+        self._drop_orphans([color] + old_inner)
+
+    def _drop_orphans(self, colors: List[str]) -> None:
+        # Colors without a rule which nothing refers to any more leave the graph, as they would not be in a fresh one.
+        # They hold nothing and nothing holds them, so their bits are already gone from every bitset and the ids can be
+        # handed out again.
+        for color in colors:
+            if color in self._grid and color not in self._rules and not self._grid[color].outer:
+                del self._grid[color], self._counts[color], self._ancestors[color]
+                color_id = self._ids.pop(color)
+                self._colors[color_id] = None
+                heapq.heappush(self._free_ids, color_id)
+
+    def _replace(self, color: str, inner: List[BagRule]) -> List[str]:
+        for _, inner_color in inner:
+            known = color in self._grid and inner_color in self._grid
+            if inner_color == color or known and self.can_contain(inner_color, color):
+                raise ValueError(f'Rule for {color} bags makes a cycle through {inner_color} bags.')
+
+        for name in [color] + [inner_color for _, inner_color in inner]:
+            if name not in self._grid:
+                self._add_color(name)
+
+        node = self._grid[color]
+        old_inner = [inner_color for _, inner_color in node.inner]
+        changed = set(old_inner) | {inner_color for _, inner_color in inner}
+        for _, inner_color in node.inner:
+            self._grid[inner_color].outer.remove(color)
+        for _, inner_color in inner:
+            self._grid[inner_color].outer.append(color)
+        node.inner = list(inner)
+
+        # The contents can change for the color and everything holding it, the containers for everything inside the
+        # old and the new inner colors; the rest of the graph keeps its cached values.
+        self._recount({color} | self._decode(self._ancestors[color]), {color})
+        self._reindex(self._descendants(changed), changed)
+        return old_inner
+
+    def _add_color(self, color: str) -> None:
+        self._grid[color] = BagRuleNode(color)
+        if self._free_ids:
+            self._ids[color] = heapq.heappop(self._free_ids)
+            self._colors[self._ids[color]] = color
+        else:
+            self._ids[color] = len(self._colors)
+            self._colors.append(color)
+        self._counts[color] = 0
+        self._ancestors[color] = 0
+
+    def _recount(self, colors: Set[str], dirty: Set[str]) -> None:
+        # Same order as in inner_bag_counts, restricted to colors: their inner colors outside of it are up to date.
+        # Only the dirty colors are counted again, and a new count makes the colors holding it dirty in turn.
+        pending = {color: sum(inner_color in colors for _, inner_color in self._grid[color].inner) for color in colors}
+        ready = deque(color for color, count in pending.items() if count == 0)
+
+        while ready:
+            color = ready.popleft()
+            if color in dirty:
+                count = sum(amount * (self._counts[inner_color] + 1) for amount, inner_color in self._grid[color].inner)
+                if count != self._counts[color]:
+                    self._counts[color] = count
+                    dirty.update(self._grid[color].outer)
+
+            for outer_color in self._grid[color].outer:
+                if outer_color in pending:
+                    pending[outer_color] -= 1
+                    if pending[outer_color] == 0:
+                        ready.append(outer_color)
+
+    def _reindex(self, colors: Set[str], dirty: Set[str]) -> None:
+        pending = {color: sum(outer_color in colors for outer_color in self._grid[color].outer) for color in colors}
+        ready = deque(color for color, count in pending.items() if count == 0)
+
+        while ready:
+            color = ready.popleft()
+            if color in dirty:
+                ancestors = 0
+                for outer_color in self._grid[color].outer:
+                    ancestors |= self._ancestors[outer_color] | 1 << self._ids[outer_color]
+                if ancestors != self._ancestors[color]:
+                    self._ancestors[color] = ancestors
+                    dirty.update(inner_color for _, inner_color in self._grid[color].inner)
+
+            for _, inner_color in self._grid[color].inner:
+                if inner_color in pending:
+                    pending[inner_color] -= 1
+                    if pending[inner_color] == 0:
+                        ready.append(inner_color)
+
+    def _descendants(self, colors: Set[str]) -> Set[str]:
+        descendants = set(colors)
+        stack = list(colors)
+
+        while stack:
+            for _, inner_color in self._grid[stack.pop()].inner:
+                if inner_color not in descendants:
+                    descendants.add(inner_color)
+                    stack.append(inner_color)
+
+        return descendants
+
+    def _decode(self, bits: int) -> Set[str]:
+        return {self._colors[i] for i, bit in enumerate(reversed(bin(bits))) if bit == '1'}
+
+
 def part1(bag_color: str, bag_rules: List[str]) -> int:
     grid = _parse_rules(bag_rules)
-    return _outer_dfs(bag_color, grid, set())
+    return BagIndex(grid).containers(bag_color)
 
 
 def part2(bag_color: str, bag_rules: List[str]) -> int:
     grid = _parse_rules(bag_rules)
-    return _inner_dfs(bag_color, grid)
+    return inner_bag_counts(grid)[bag_color]
+
+
+def _ancestor_bitsets(grid: Dict[str, BagRuleNode]) -> Tuple[Dict[str, int], List[int]]:
+    # Colors get ids from the outermost ones inwards, so all the ancestors of a color have lower ids than it has and
+    # its ancestor bitset is no longer than its own id.
+    pending = {color: len(node.outer) for color, node in grid.items()}
+    ready = deque(color for color, count in pending.items() if count == 0)
+    ids = {}
+    ancestor_sets = []
+
+    while ready:
+        color = ready.popleft()
+        ids[color] = len(ancestor_sets)
+        ancestors = 0
+        for outer_color in grid[color].outer:
+            outer_id = ids[outer_color]
+            ancestors |= ancestor_sets[outer_id] | 1 << outer_id
+        ancestor_sets.append(ancestors)
+
+        for _, inner_color in grid[color].inner:
+            pending[inner_color] -= 1
+            if pending[inner_color] == 0:
+                ready.append(inner_color)
+
+    if len(ids) < len(grid):
+        raise ValueError(f'Bag rules contain a cycle through {len(grid) - len(ids)} colors.')
+
+    return ids, ancestor_sets
 
 
+def inner_bag_counts(grid: Dict[str, BagRuleNode]) -> Dict[str, int]:
+    # Colors are counted from the ones holding nothing outwards: a color is ready once all of its inner colors are, so
+    # every rule is visited once and each count is then a dict lookup.
+    pending = {color: len(node.inner) for color, node in grid.items()}
+    ready = deque(color for color, count in pending.items() if count == 0)
+    counts = {}
+
+    while ready:
+        color = ready.popleft()
+        counts[color] = sum(amount * (counts[inner_color] + 1) for amount, inner_color in grid[color].inner)
+
+        for outer_color in grid[color].outer:
+            pending[outer_color] -= 1
+            if pending[outer_color] == 0:
+                ready.append(outer_color)
+
+    if len(counts) < len(grid):
+        raise ValueError(f'Bag rules contain a cycle through {len(grid) - len(counts)} colors.')
+
+    return counts
+
+
+# The search from a single color is the reference for BagIndex.containers.
 def _outer_dfs(color: str, grid: Dict[str, BagRuleNode], visited: Set[str]) -> int:
     amount = 0
 
@@ -40,6 +254,7 @@ def _outer_dfs(color: str, grid: Dict[str, BagRuleNode], visited: Set[str]) -> i
     return amount
 
 
+# The recursive traversal is the reference for inner_bag_counts.
 def _inner_dfs(color: str, grid: Dict[str, BagRuleNode]) -> int:
     amount = 0
 
@@ -49,17 +264,21 @@ def _inner_dfs(color: str, grid: Dict[str, BagRuleNode]) -> int:
     return amount
 
 
+def _parse_rule(line: str) -> Tuple[str, List[BagRule]]:
+    outer_color = re.findall(r'^([a-z ]+) bags contain', line)[0]
+    return outer_color, [BagRule(int(amount), color) for amount, color in re.findall(r'(\d+) ([a-z ]+) bag', line)]
+
+
 def _parse_rules(bag_rules: List[str]) -> Dict[str, BagRuleNode]:
     grid = dict()
 
     for line in bag_rules:
-        outer_color = re.findall(r'^([a-z ]+) bags contain', line)[0]
+        outer_color, inner_bags = _parse_rule(line)
         if outer_color not in grid:
             grid[outer_color] = BagRuleNode(outer_color)
 
-        inner_bags = re.findall(r'(\d+) ([a-z ]+) bag', line)
         for amount, inner_color in inner_bags:
-            grid[outer_color].inner.append(BagRule(int(amount), inner_color))
+            grid[outer_color].inner.append(BagRule(amount, inner_color))
 
             if inner_color not in grid:
                 grid[inner_color] = BagRuleNode(inner_color)
@@ -72,44 +291,104 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(4, part1('shiny gold', [
-    'light red bags contain 1 bright white bag, 2 muted yellow bags.',
-    'dark orange bags contain 3 bright white bags, 4 muted yellow bags.',
-    'bright white bags contain 1 shiny gold bag.',
-    'muted yellow bags contain 2 shiny gold bags, 9 faded blue bags.',
-    'shiny gold bags contain 1 dark olive bag, 2 vibrant plum bags.',
-    'dark olive bags contain 3 faded blue bags, 4 dotted black bags.',
-    'vibrant plum bags contain 5 faded blue bags, 6 dotted black bags.',
-    'faded blue bags contain no other bags.',
-    'dotted black bags contain no other bags.',
-]))
-
-test(32, part2('shiny gold', [
-    'light red bags contain 1 bright white bag, 2 muted yellow bags.',
-    'dark orange bags contain 3 bright white bags, 4 muted yellow bags.',
-    'bright white bags contain 1 shiny gold bag.',
-    'muted yellow bags contain 2 shiny gold bags, 9 faded blue bags.',
-    'shiny gold bags contain 1 dark olive bag, 2 vibrant plum bags.',
-    'dark olive bags contain 3 faded blue bags, 4 dotted black bags.',
-    'vibrant plum bags contain 5 faded blue bags, 6 dotted black bags.',
-    'faded blue bags contain no other bags.',
-    'dotted black bags contain no other bags.',
-]))
-
-test(126, part2('shiny gold', [
-    'shiny gold bags contain 2 dark red bags.',
-    'dark red bags contain 2 dark orange bags.',
-    'dark orange bags contain 2 dark yellow bags.',
-    'dark yellow bags contain 2 dark green bags.',
-    'dark green bags contain 2 dark blue bags.',
-    'dark blue bags contain 2 dark violet bags.',
-    'dark violet bags contain no other bags.',
-]))
-
-
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day07.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
-
-    print('Day 07, part 1: %r' % (part1('shiny gold', input_data)))
-    print('Day 07, part 2: %r' % (part2('shiny gold', input_data)))
+def run_tests() -> None:
+    test(4, part1('shiny gold', [
+        'light red bags contain 1 bright white bag, 2 muted yellow bags.',
+        'dark orange bags contain 3 bright white bags, 4 muted yellow bags.',
+        'bright white bags contain 1 shiny gold bag.',
+        'muted yellow bags contain 2 shiny gold bags, 9 faded blue bags.',
+        'shiny gold bags contain 1 dark olive bag, 2 vibrant plum bags.',
+        'dark olive bags contain 3 faded blue bags, 4 dotted black bags.',
+        'vibrant plum bags contain 5 faded blue bags, 6 dotted black bags.',
+        'faded blue bags contain no other bags.',
+        'dotted black bags contain no other bags.',
+    ]))
+
+    test(32, part2('shiny gold', [
+        'light red bags contain 1 bright white bag, 2 muted yellow bags.',
+        'dark orange bags contain 3 bright white bags, 4 muted yellow bags.',
+        'bright white bags contain 1 shiny gold bag.',
+        'muted yellow bags contain 2 shiny gold bags, 9 faded blue bags.',
+        'shiny gold bags contain 1 dark olive bag, 2 vibrant plum bags.',
+        'dark olive bags contain 3 faded blue bags, 4 dotted black bags.',
+        'vibrant plum bags contain 5 faded blue bags, 6 dotted black bags.',
+        'faded blue bags contain no other bags.',
+        'dotted black bags contain no other bags.',
+    ]))
+
+    index = BagIndex(_parse_rules([
+        'c bags contain 2 b bags, 3 a bags.',
+        'b bags contain 3 a bags.',
+        'd bags contain 1 b bag.',
+    ]))
+    test(3, index.containers('a'))
+    test(0, index.containers('c'))
+    test(True, index.can_contain('d', 'a'))
+    test(False, index.can_contain('a', 'd'))
+    test(False, index.can_contain('c', 'd'))
+
+    graph = BagGraph([
+        'c bags contain 2 b bags, 3 a bags.',
+        'b bags contain 3 a bags.',
+    ])
+    test((11, 2), (graph.contents('c'), graph.containers('a')))
+    graph.set_rule('b bags contain 1 d bag.')
+    graph.set_rule('d bags contain 2 a bags.')
+    test((3, 11, 3), (graph.contents('b'), graph.contents('c'), graph.containers('a')))
+    test(True, graph.can_contain('c', 'd'))
+    try:
+        graph.remove_rule('e')
+        test('KeyError', None)
+    except KeyError:
+        test(False, 'e' in graph)
+    graph.remove_rule('c')
+    test((False, 2, 0), ('c' in graph, graph.containers('a'), graph.containers('b')))
+    try:
+        graph.set_rule('a bags contain 1 b bag.')
+        test('ValueError', None)
+    except ValueError:
+        test(3, graph.contents('b'))
+    graph.set_rule('e bags contain 1 f bag.')
+    graph.set_rule('e bags contain 1 a bag.')
+    graph.remove_rule('b')
+    test(({'a', 'd', 'e'}, 2), (set(graph), graph.containers('a')))
+    graph.remove_rule('e')
+    graph.set_rule('g bags contain 1 d bag.')
+    test(({'a', 'd', 'g'}, 5, True), (set(graph), len(graph._colors), graph.can_contain('g', 'a')))
+
+    test({'a': 0, 'b': 3, 'c': 11}, inner_bag_counts(_parse_rules([
+        'c bags contain 2 b bags, 3 a bags.',
+        'b bags contain 3 a bags.',
+    ])))
+
+    test(126, part2('shiny gold', [
+        'shiny gold bags contain 2 dark red bags.',
+        'dark red bags contain 2 dark orange bags.',
+        'dark orange bags contain 2 dark yellow bags.',
+        'dark yellow bags contain 2 dark green bags.',
+        'dark green bags contain 2 dark blue bags.',
+        'dark blue bags contain 2 dark violet bags.',
+        'dark violet bags contain no other bags.',
+    ]))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day07.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1('shiny gold', input_data)
+
+
+def solve_part2(input_data: List[str]) -> int:
+    return part2('shiny gold', input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 07, part 1: %r' % (solve_part1(input_data)))
+    print('Day 07, part 2: %r' % (solve_part2(input_data)))
@@ -85,34 +85,49 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(5, part1([
-    'nop +0',
-    'acc +1',
-    'jmp +4',
-    'acc +3',
-    'jmp -3',
-    'acc -99',
-    'acc +1',
-    'jmp -4',
-    'acc +6',
-]))
-
-test(8, part2([
-    'nop +0',
-    'acc +1',
-    'jmp +4',
-    'acc +3',
-    'jmp -3',
-    'acc -99',
-    'acc +1',
-    'jmp -4',
-    'acc +6',
-]))
-
-
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day08.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
-
-    print('Day 08, part 1: %r' % (part1(input_data)))
-    print('Day 08, part 2: %r' % (part2(input_data)))
+def run_tests() -> None:
+    test(5, part1([
+        'nop +0',
+        'acc +1',
+        'jmp +4',
+        'acc +3',
+        'jmp -3',
+        'acc -99',
+        'acc +1',
+        'jmp -4',
+        'acc +6',
+    ]))
+
+    test(8, part2([
+        'nop +0',
+        'acc +1',
+        'jmp +4',
+        'acc +3',
+        'jmp -3',
+        'acc -99',
+        'acc +1',
+        'jmp -4',
+        'acc +6',
+    ]))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day08.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: List[str]) -> int:
+    return part2(input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 08, part 1: %r' % (solve_part1(input_data)))
+    print('Day 08, part 2: %r' % (solve_part2(input_data)))
@@ -50,15 +50,31 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(127, part1([35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127, 219, 299, 277, 309, 576],
-                preamble=5))
+def run_tests() -> None:
+    test(127, part1([35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127, 219, 299, 277, 309, 576],
+                    preamble=5))
 
-test(62, part2([35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127, 219, 299, 277, 309, 576],
-               preamble=5))
+    test(62, part2([35, 20, 15, 25, 47, 40, 62, 55, 65, 95, 102, 117, 150, 182, 127, 219, 299, 277, 309, 576],
+                   preamble=5))
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day09.txt')
-with open(file_path, 'r') as f:
-    input_data = [int(line.strip()) for line in f.readlines()]
 
-    print('Day 09, part 1: %r' % (part1(input_data, preamble=25)))
-    print('Day 09, part 2: %r' % (part2(input_data, preamble=25)))
+def read_input(file_path: str = None) -> List[int]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day09.txt')
+    with open(file_path, 'r') as f:
+        return [int(line.strip()) for line in f.readlines()]
+
+
+def solve_part1(input_data: List[int]) -> int:
+    return part1(input_data, preamble=25)
+
+
+def solve_part2(input_data: List[int]) -> int:
+    return part2(input_data, preamble=25)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 09, part 1: %r' % (solve_part1(input_data)))
+    print('Day 09, part 2: %r' % (solve_part2(input_data)))
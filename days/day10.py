@@ -38,19 +38,33 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(35, part1([16, 10, 15, 5, 1, 11, 7, 19, 6, 12, 4]))
-test(220, part1([28, 33, 18, 42, 31, 14, 46, 20, 48, 47, 24, 23, 49, 45, 19,
-                 38, 39, 11, 1, 32, 25, 35, 8, 17, 7, 9, 4, 2, 34, 10, 3]))
+def run_tests() -> None:
+    test(35, part1([16, 10, 15, 5, 1, 11, 7, 19, 6, 12, 4]))
+    test(220, part1([28, 33, 18, 42, 31, 14, 46, 20, 48, 47, 24, 23, 49, 45, 19,
+                     38, 39, 11, 1, 32, 25, 35, 8, 17, 7, 9, 4, 2, 34, 10, 3]))
 
+    test(8, part2([16, 10, 15, 5, 1, 11, 7, 19, 6, 12, 4]))
+    test(19208, part2([28, 33, 18, 42, 31, 14, 46, 20, 48, 47, 24, 23, 49, 45, 19,
+                       38, 39, 11, 1, 32, 25, 35, 8, 17, 7, 9, 4, 2, 34, 10, 3]))
 
-test(8, part2([16, 10, 15, 5, 1, 11, 7, 19, 6, 12, 4]))
-test(19208, part2([28, 33, 18, 42, 31, 14, 46, 20, 48, 47, 24, 23, 49, 45, 19,
-                   38, 39, 11, 1, 32, 25, 35, 8, 17, 7, 9, 4, 2, 34, 10, 3]))
 
+def read_input(file_path: str = None) -> List[int]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day10.txt')
+    with open(file_path, 'r') as f:
+        return [int(line.strip()) for line in f.readlines()]
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day10.txt')
-with open(file_path, 'r') as f:
-    input_data = [int(line.strip()) for line in f.readlines()]
 
-    print('Day 10, part 1: %r' % (part1(input_data)))
-    print('Day 10, part 2: %r' % (part2(input_data)))
+def solve_part1(input_data: List[int]) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: List[int]) -> int:
+    return part2(input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 10, part 1: %r' % (solve_part1(input_data)))
+    print('Day 10, part 2: %r' % (solve_part2(input_data)))
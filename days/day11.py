@@ -1,16 +1,62 @@
 import os
 
-from typing import List
+from typing import Iterator, List, Tuple
 
 
 def part1(seats: List[str]) -> int:
-    return _calculate_seats(seats, 1)
+    return _settle_seats(seats, 1)
 
 
 def part2(seats: List[str]) -> int:
-    return _calculate_seats(seats, 2)
+    return _settle_seats(seats, 2)
 
 
+def _settle_seats(seats: List[str], rules: int) -> int:
+    positions, neighbors = _seat_neighbors(seats, visible=rules == 2)
+    occupied = [seats[y][x] == '#' for y, x in positions]
+    for _ in _flip_rounds(neighbors, occupied, tolerance=4 if rules == 1 else 5):
+        pass
+    return sum(occupied)
+
+
+def _flip_rounds(neighbors: List[List[int]], occupied: List[bool], tolerance: int) -> Iterator[List[int]]:
+    # Flips the seats round by round in occupied and yields the seats flipped in each round until none is. Only the
+    # seats around the ones flipped in the previous round may flip, so each round checks just those.
+    counts = [sum(1 for j in seat_neighbors if occupied[j]) for seat_neighbors in neighbors]
+    candidates = range(len(neighbors))
+
+    while True:
+        flips = [i for i in candidates if (counts[i] >= tolerance if occupied[i] else counts[i] == 0)]
+        if not flips:
+            return
+
+        candidates = set(flips)
+        for i in flips:
+            occupied[i] = not occupied[i]
+            for j in neighbors[i]:
+                counts[j] += 1 if occupied[i] else -1
+                candidates.add(j)
+        yield flips
+
+
+def _seat_neighbors(seats: List[str], visible: bool) -> Tuple[List[Tuple[int, int]], List[List[int]]]:
+    height, width = len(seats), len(seats[0]) if seats else 0
+    positions = [(y, x) for y in range(height) for x in range(width) if seats[y][x] != '.']
+    ids = {position: i for i, position in enumerate(positions)}
+    neighbors = [[] for _ in positions]
+
+    for (y, x), i in ids.items():
+        for dy, dx in [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]:
+            ny, nx = y + dy, x + dx
+            while visible and 0 <= ny < height and 0 <= nx < width and (ny, nx) not in ids:
+                ny, nx = ny + dy, nx + dx
+            if (ny, nx) in ids:
+                neighbors[i].append(ids[ny, nx])
+
+    return positions, neighbors
+
+
+# The cell by cell simulation below is the reference for _settle_seats.
 def _calculate_seats(seats: List[str], rules: int) -> int:
     next_state = _next_seat_state_rules_1 if rules == 1 else _next_seat_state_rules_2
 
@@ -91,35 +137,51 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(37, part1([
-    'L.LL.LL.LL',
-    'LLLLLLL.LL',
-    'L.L.L..L..',
-    'LLLL.LL.LL',
-    'L.LL.LL.LL',
-    'L.LLLLL.LL',
-    '..L.L.....',
-    'LLLLLLLLLL',
-    'L.LLLLLL.L',
-    'L.LLLLL.LL',
-]))
-
-test(26, part2([
-    'L.LL.LL.LL',
-    'LLLLLLL.LL',
-    'L.L.L..L..',
-    'LLLL.LL.LL',
-    'L.LL.LL.LL',
-    'L.LLLLL.LL',
-    '..L.L.....',
-    'LLLLLLLLLL',
-    'L.LLLLLL.L',
-    'L.LLLLL.LL',
-]))
-
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day11.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
-
-    print('Day 11, part 1: %r' % (part1(input_data)))
-    print('Day 11, part 2: %r' % (part2(input_data)))
+def run_tests() -> None:
+    test(37, part1([
+        'L.LL.LL.LL',
+        'LLLLLLL.LL',
+        'L.L.L..L..',
+        'LLLL.LL.LL',
+        'L.LL.LL.LL',
+        'L.LLLLL.LL',
+        '..L.L.....',
+        'LLLLLLLLLL',
+        'L.LLLLLL.L',
+        'L.LLLLL.LL',
+    ]))
+
+    test(26, part2([
+        'L.LL.LL.LL',
+        'LLLLLLL.LL',
+        'L.L.L..L..',
+        'LLLL.LL.LL',
+        'L.LL.LL.LL',
+        'L.LLLLL.LL',
+        '..L.L.....',
+        'LLLLLLLLLL',
+        'L.LLLLLL.L',
+        'L.LLLLL.LL',
+    ]))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day11.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: List[str]) -> int:
+    return part2(input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 11, part 1: %r' % (solve_part1(input_data)))
+    print('Day 11, part 2: %r' % (solve_part2(input_data)))
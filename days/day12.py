@@ -99,27 +99,41 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(25, part1([
-    'F10',
-    'N3',
-    'F7',
-    'R90',
-    'F11',
-]))
-
-
-test(286, part2([
-    'F10',
-    'N3',
-    'F7',
-    'R90',
-    'F11',
-]))
-
-
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day12.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
-
-    print('Day 12, part 1: %r' % (part1(input_data)))
-    print('Day 12, part 2: %r' % (part2(input_data)))
+def run_tests() -> None:
+    test(25, part1([
+        'F10',
+        'N3',
+        'F7',
+        'R90',
+        'F11',
+    ]))
+
+    test(286, part2([
+        'F10',
+        'N3',
+        'F7',
+        'R90',
+        'F11',
+    ]))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day12.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: List[str]) -> int:
+    return part2(input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 12, part 1: %r' % (solve_part1(input_data)))
+    print('Day 12, part 2: %r' % (solve_part2(input_data)))
@@ -1,5 +1,7 @@
 import os
 
+from typing import Tuple
+
 
 # References:
 # 1. Chinese remainder theorem (https://en.wikipedia.org/wiki/Chinese_remainder_theorem)
@@ -65,22 +67,37 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(295, part1(939, '7,13,x,x,59,x,31,19'))
+def run_tests() -> None:
+    test(295, part1(939, '7,13,x,x,59,x,31,19'))
+
+    test(6, part2('3, 7'))
+    test(174, part2('3, 7, 11'))
+    test(1068781, part2('7,13,x,x,59,x,31,19'))
+    test(3417, part2('17,x,13,19'))
+    test(754018, part2('67,7,59,61'))
+    test(779210, part2('67,x,7,59,61'))
+    test(1261476, part2('67,7,x,59,61'))
+    test(1202161486, part2('1789,37,47,1889'))
+
+
+def read_input(file_path: str = None) -> Tuple[int, str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day13.txt')
+    with open(file_path, 'r') as f:
+        timestamp = int(f.readline().strip())
+        return timestamp, f.readline().strip()
+
+
+def solve_part1(input_data: Tuple[int, str]) -> int:
+    return part1(*input_data)
+
 
-test(6, part2('3, 7'))
-test(174, part2('3, 7, 11'))
-test(1068781, part2('7,13,x,x,59,x,31,19'))
-test(3417, part2('17,x,13,19'))
-test(754018, part2('67,7,59,61'))
-test(779210, part2('67,x,7,59,61'))
-test(1261476, part2('67,7,x,59,61'))
-test(1202161486, part2('1789,37,47,1889'))
+def solve_part2(input_data: Tuple[int, str]) -> int:
+    return part2(input_data[1])
 
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day13.txt')
-with open(file_path, 'r') as f:
-    timestamp = int(f.readline().strip())
-    input_data = f.readline().strip()
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 13, part 1: %r' % (part1(timestamp, input_data)))
-    print('Day 13, part 2: %r' % (part2(input_data)))
+    input_data = read_input()
+    print('Day 13, part 1: %r' % (solve_part1(input_data)))
+    print('Day 13, part 2: %r' % (solve_part2(input_data)))
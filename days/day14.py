@@ -85,32 +85,48 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(73, _apply_mask_v1('XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X', 11))
-test(101, _apply_mask_v1('XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X', 101))
-test(64, _apply_mask_v1('XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X', 0))
-
-test('000000000000000000000000000000X1101X', _apply_mask_v2('000000000000000000000000000000X1001X', 42))
-test('00000000000000000000000000000001X0XX', _apply_mask_v2('00000000000000000000000000000000X0XX', 26))
-
-test([18, 19, 50, 51], _generate_addresses('000000000000000000000000000000X1001X'))
-
-test(165, part1([
-    'mask = XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X',
-    'mem[8] = 11',
-    'mem[7] = 101',
-    'mem[8] = 0',
-]))
-
-test(208, part2([
-    'mask = 000000000000000000000000000000X1001X',
-    'mem[42] = 100',
-    'mask = 00000000000000000000000000000000X0XX',
-    'mem[26] = 1',
-]))
-
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day14.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
-
-    print('Day 14, part 1: %r' % (part1(input_data)))
-    print('Day 14, part 2: %r' % (part2(input_data)))
+def run_tests() -> None:
+    test(73, _apply_mask_v1('XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X', 11))
+    test(101, _apply_mask_v1('XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X', 101))
+    test(64, _apply_mask_v1('XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X', 0))
+
+    test('000000000000000000000000000000X1101X', _apply_mask_v2('000000000000000000000000000000X1001X', 42))
+    test('00000000000000000000000000000001X0XX', _apply_mask_v2('00000000000000000000000000000000X0XX', 26))
+
+    test([18, 19, 50, 51], _generate_addresses('000000000000000000000000000000X1001X'))
+
+    test(165, part1([
+        'mask = XXXXXXXXXXXXXXXXXXXXXXXXXXXXX1XXXX0X',
+        'mem[8] = 11',
+        'mem[7] = 101',
+        'mem[8] = 0',
+    ]))
+
+    test(208, part2([
+        'mask = 000000000000000000000000000000X1001X',
+        'mem[42] = 100',
+        'mask = 00000000000000000000000000000000X0XX',
+        'mem[26] = 1',
+    ]))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day14.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: List[str]) -> int:
+    return part2(input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 14, part 1: %r' % (solve_part1(input_data)))
+    print('Day 14, part 2: %r' % (solve_part2(input_data)))
@@ -5,6 +5,10 @@ from collections import defaultdict
 from typing import List, Tuple, Dict, Set
 
 
+# Parsers whose results the runner may cache on disk, with their version.
+CACHED_PARSERS = {'_parse_data': 1}
+
+
 def part1(tickets_data: str) -> int:
     rules, tickets = _parse_data(tickets_data)
     validation_set = _generate_validation_set(rules)
@@ -101,7 +105,8 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(71, part1("""
+def run_tests() -> None:
+    test(71, part1("""
 class: 1-3 or 5-7
 row: 6-11 or 33-44
 seat: 13-40 or 45-50
@@ -116,7 +121,7 @@ nearby tickets:
 38,6,12
 """))
 
-test(143, part2("""
+    test(143, part2("""
 class: 0-1 or 4-19
 departure row: 0-5 or 8-19
 departure seat: 0-13 or 16-19
@@ -131,9 +136,23 @@ nearby tickets:
 """))
 
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day16.txt')
-with open(file_path, 'r') as f:
-    input_data = f.read()
+def read_input(file_path: str = None) -> str:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day16.txt')
+    with open(file_path, 'r') as f:
+        return f.read()
+
+
+def solve_part1(input_data: str) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: str) -> int:
+    return part2(input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 16, part 1: %r' % (part1(input_data)))
-    print('Day 16, part 2: %r' % (part2(input_data)))
+    input_data = read_input()
+    print('Day 16, part 1: %r' % (solve_part1(input_data)))
+    print('Day 16, part 2: %r' % (solve_part2(input_data)))
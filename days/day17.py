@@ -191,23 +191,37 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(112, part1("""
+def run_tests() -> None:
+    test(112, part1("""
 .#.
 ..#
 ###
 """, cycles=6))
 
-
-test(848, part2("""
+    test(848, part2("""
 .#.
 ..#
 ###
 """, cycles=6))
 
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day17.txt')
-with open(file_path, 'r') as f:
-    input_data = f.read()
+def read_input(file_path: str = None) -> str:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day17.txt')
+    with open(file_path, 'r') as f:
+        return f.read()
+
+
+def solve_part1(input_data: str) -> int:
+    return part1(input_data, cycles=6)
+
+
+def solve_part2(input_data: str) -> int:
+    return part2(input_data, cycles=6)
+
+
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 17, part 1: %r' % (part1(input_data, cycles=6)))
-    print('Day 17, part 2: %r' % (part2(input_data, cycles=6)))
+    input_data = read_input()
+    print('Day 17, part 1: %r' % (solve_part1(input_data)))
+    print('Day 17, part 2: %r' % (solve_part2(input_data)))
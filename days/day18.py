@@ -1,22 +1,56 @@
 import os
 
-from typing import List
+from typing import Dict, List
+
+
+EQUAL_PRECEDENCE = {'+': 1, '*': 1}
+ADDITIONS_FIRST = {'+': 2, '*': 1}
 
 
 def part1(expressions: List[str]) -> int:
     calc_sum = 0
     for expression in expressions:
-        calc_sum += _calculator_equal_precedence(expression)
+        calc_sum += _evaluate(expression, EQUAL_PRECEDENCE)
     return calc_sum
 
 
 def part2(expressions: List[str]) -> int:
     calc_sum = 0
     for expression in expressions:
-        calc_sum += _calculator_additions_first(expression)
+        calc_sum += _evaluate(expression, ADDITIONS_FIRST)
     return calc_sum
 
 
+def _evaluate(expression: str, precedence: Dict[str, int]) -> int:
+    values, operators = [], []
+
+    def apply() -> None:
+        op = operators.pop()
+        arg2 = values.pop()
+        arg1 = values.pop()
+        values.append(arg1 * arg2 if op == '*' else arg1 + arg2)
+
+    for ch in expression:
+        if ch.isdigit():
+            values.append(int(ch))
+        elif ch == '(':
+            operators.append(ch)
+        elif ch == ')':
+            while operators[-1] != '(':
+                apply()
+            operators.pop()
+        elif ch in precedence:
+            while operators and operators[-1] != '(' and precedence[operators[-1]] >= precedence[ch]:
+                apply()
+            operators.append(ch)
+
+    while operators:
+        apply()
+
+    return values[0]
+
+
+# The calculators below are the references for _evaluate with each of the precedence tables.
 def _calculator_equal_precedence(expression: str) -> int:
     expression = expression.replace(' ', '')
     stack = []
@@ -105,29 +139,43 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(85, part1(['1 + ((2 * (3 + 4) * 2) * 3)']))
-test(71, part1(['1 + 2 * 3 + 4 * 5 + 6']))
-test(51, part1(['1 + (2 * 3) + (4 * (5 + 6))']))
-test(26, part1(['2 * 3 + (4 * 5)']))
-test(437, part1(['5 + (8 * 3 + 9 + 3 * 4 * 3)']))
-test(12240, part1(['5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))']))
-test(13632, part1(['((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2']))
+def run_tests() -> None:
+    test(85, part1(['1 + ((2 * (3 + 4) * 2) * 3)']))
+    test(71, part1(['1 + 2 * 3 + 4 * 5 + 6']))
+    test(51, part1(['1 + (2 * 3) + (4 * (5 + 6))']))
+    test(26, part1(['2 * 3 + (4 * 5)']))
+    test(437, part1(['5 + (8 * 3 + 9 + 3 * 4 * 3)']))
+    test(12240, part1(['5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))']))
+    test(13632, part1(['((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2']))
+
+    test(85, part2(['1 + ((2 * (3 + 4) * 2) * 3)']))
+    test(231, part2(['1 + 2 * 3 + 4 * 5 + 6']))
+    test(51, part2(['1 + (2 * 3) + (4 * (5 + 6))']))
+    test(46, part2(['2 * 3 + (4 * 5)']))
+    test(1445, part2(['5 + (8 * 3 + 9 + 3 * 4 * 3)']))
+    test(669060, part2(['5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))']))
+    test(23340, part2(['((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2']))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day18.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1(input_data)
 
 
-test(85, part2(['1 + ((2 * (3 + 4) * 2) * 3)']))
-test(231, part2(['1 + 2 * 3 + 4 * 5 + 6']))
-test(51, part2(['1 + (2 * 3) + (4 * (5 + 6))']))
-test(46, part2(['2 * 3 + (4 * 5)']))
-test(1445, part2(['5 + (8 * 3 + 9 + 3 * 4 * 3)']))
-test(669060, part2(['5 * 9 * (7 * 3 * 3 + 9 * 3 + (8 + 6 * 4))']))
-test(23340, part2(['((2 + 4 * 9) * (6 + 9 * 8 + 6) + 6) + 2 + 4 * 2']))
+def solve_part2(input_data: List[str]) -> int:
+    return part2(input_data)
 
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day18.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 18, part 1: %r' % (part1(input_data)))
-    print('Day 18, part 2: %r' % (part2(input_data)))
+    input_data = read_input()
+    print('Day 18, part 1: %r' % (solve_part1(input_data)))
+    print('Day 18, part 2: %r' % (solve_part2(input_data)))
 
 # 15773593539749 - wrong
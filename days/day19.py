@@ -4,6 +4,10 @@ import re
 from typing import List, Dict, Tuple
 
 
+# Parsers whose results the runner may cache on disk, with their version.
+CACHED_PARSERS = {'_parse_message_data': 1}
+
+
 def part1(raw_message: str) -> int:
     rules, messages = _parse_message_data(raw_message)
     rule = _rules_backtrack(rules)[0]
@@ -108,7 +112,8 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(2, part1("""
+def run_tests() -> None:
+    test(2, part1("""
 0: 4 1 5
 1: 2 3 | 3 2
 2: 4 4 | 5 5
@@ -123,7 +128,7 @@ aaabbb
 aaaabbb
 """))
 
-test(3, part1("""
+    test(3, part1("""
 42: 9 14 | 10 1
 9: 14 27 | 1 26
 10: 23 14 | 28 1
@@ -173,8 +178,7 @@ babaaabbbaaabaababbaabababaaab
 aabbbbbaabbbaaaaaabbbbbababaaaaabbaaabba
 """))
 
-
-test(12, part2("""
+    test(12, part2("""
 42: 9 14 | 10 1
 9: 14 27 | 1 26
 10: 23 14 | 28 1
@@ -223,17 +227,31 @@ aaaabbaabbaaaaaaabbbabbbaaabbaabaaa
 babaaabbbaaabaababbaabababaaab
 aabbbbbaabbbaaaaaabbbbbababaaaaabbaaabba
 """, replacements={
-    '8: 42': '8: 42 | 42 8',
-    '11: 42 31': '11: 42 31 | 42 11 31'
-}))
+        '8: 42': '8: 42 | 42 8',
+        '11: 42 31': '11: 42 31 | 42 11 31'
+    }))
+
 
+def read_input(file_path: str = None) -> str:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day19.txt')
+    with open(file_path, 'r') as f:
+        return f.read()
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day19.txt')
-with open(file_path, 'r') as f:
-    input_data = f.read()
 
-    print('Day 19, part 1: %r' % (part1(input_data)))
-    print('Day 19, part 2: %r' % (part2(input_data, replacements={
+def solve_part1(input_data: str) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: str) -> int:
+    return part2(input_data, replacements={
         '8: 42': '8: 42 | 42 8',
         '11: 42 31': '11: 42 31 | 42 11 31'
-    })))
+    })
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 19, part 1: %r' % (solve_part1(input_data)))
+    print('Day 19, part 2: %r' % (solve_part2(input_data)))
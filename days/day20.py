@@ -7,6 +7,9 @@ from typing import List, Dict, Tuple, Set
 
 TileVariants = namedtuple('TileVariants', ['id', 'position'])
 
+# Parsers whose results the runner may cache on disk, with their version.
+CACHED_PARSERS = {'_parse_data': 1}
+
 
 class Tile:
     def __init__(self, id_: int, data: List[List[str]]):
@@ -281,7 +284,8 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(20899048083289, part1("""
+def run_tests() -> None:
+    test(20899048083289, part1("""
 Tile 2311:
 ..##.#..#.
 ##..#.....
@@ -391,8 +395,7 @@ Tile 3079:
 ..#.###...
 """))
 
-
-test(273, part2("""
+    test(273, part2("""
 Tile 2311:
 ..##.#..#.
 ##..#.....
@@ -503,9 +506,23 @@ Tile 3079:
 """))
 
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day20.txt')
-with open(file_path, 'r') as f:
-    input_data = f.read()
+def read_input(file_path: str = None) -> str:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day20.txt')
+    with open(file_path, 'r') as f:
+        return f.read()
+
+
+def solve_part1(input_data: str) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: str) -> int:
+    return part2(input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 20, part 1: %r' % (part1(input_data)))
-    print('Day 20, part 2: %r' % (part2(input_data)))
+    input_data = read_input()
+    print('Day 20, part 1: %r' % (solve_part1(input_data)))
+    print('Day 20, part 2: %r' % (solve_part2(input_data)))
@@ -76,24 +76,39 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(5, part1([
-    'mxmxvkd kfcds sqjhc nhms (contains dairy, fish)',
-    'trh fvjkl sbzzf mxmxvkd (contains dairy)',
-    'sqjhc fvjkl (contains soy)',
-    'sqjhc mxmxvkd sbzzf (contains fish)',
-]))
-
-test('mxmxvkd,sqjhc,fvjkl', part2([
-    'mxmxvkd kfcds sqjhc nhms (contains dairy, fish)',
-    'trh fvjkl sbzzf mxmxvkd (contains dairy)',
-    'sqjhc fvjkl (contains soy)',
-    'sqjhc mxmxvkd sbzzf (contains fish)',
-]))
-
-
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day21.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
-
-    print('Day 21, part 1: %r' % (part1(input_data)))
-    print('Day 21, part 2: %r' % (part2(input_data)))
+def run_tests() -> None:
+    test(5, part1([
+        'mxmxvkd kfcds sqjhc nhms (contains dairy, fish)',
+        'trh fvjkl sbzzf mxmxvkd (contains dairy)',
+        'sqjhc fvjkl (contains soy)',
+        'sqjhc mxmxvkd sbzzf (contains fish)',
+    ]))
+
+    test('mxmxvkd,sqjhc,fvjkl', part2([
+        'mxmxvkd kfcds sqjhc nhms (contains dairy, fish)',
+        'trh fvjkl sbzzf mxmxvkd (contains dairy)',
+        'sqjhc fvjkl (contains soy)',
+        'sqjhc mxmxvkd sbzzf (contains fish)',
+    ]))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day21.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: List[str]) -> str:
+    return part2(input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 21, part 1: %r' % (solve_part1(input_data)))
+    print('Day 21, part 2: %r' % (solve_part2(input_data)))
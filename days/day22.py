@@ -92,49 +92,65 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(306, part1([
-    'Player 1:',
-    '9',
-    '2',
-    '6',
-    '3',
-    '1',
-    'Player 2:',
-    '5',
-    '8',
-    '4',
-    '7',
-    '10',
-]))
-
-test(105, part2([
-    'Player 1:',
-    '43',
-    '19',
-    'Player 2:',
-    '2',
-    '29',
-    '14',
-]))
-
-test(291, part2([
-    'Player 1:',
-    '9',
-    '2',
-    '6',
-    '3',
-    '1',
-    'Player 2:',
-    '5',
-    '8',
-    '4',
-    '7',
-    '10',
-]))
-
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day22.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
-
-    print('Day 22, part 1: %r' % (part1(input_data)))
-    print('Day 22, part 2: %r' % (part2(input_data)))
+def run_tests() -> None:
+    test(306, part1([
+        'Player 1:',
+        '9',
+        '2',
+        '6',
+        '3',
+        '1',
+        'Player 2:',
+        '5',
+        '8',
+        '4',
+        '7',
+        '10',
+    ]))
+
+    test(105, part2([
+        'Player 1:',
+        '43',
+        '19',
+        'Player 2:',
+        '2',
+        '29',
+        '14',
+    ]))
+
+    test(291, part2([
+        'Player 1:',
+        '9',
+        '2',
+        '6',
+        '3',
+        '1',
+        'Player 2:',
+        '5',
+        '8',
+        '4',
+        '7',
+        '10',
+    ]))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day22.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: List[str]) -> int:
+    return part2(input_data)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 22, part 1: %r' % (solve_part1(input_data)))
+    print('Day 22, part 2: %r' % (solve_part2(input_data)))
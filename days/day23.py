@@ -86,14 +86,29 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test('92658374', part1('389125467', turns=10))
-test('67384529', part1('389125467', turns=100))
-test(149245887792, part2('389125467', turns=10000000, cups_amount=1000000))
+def run_tests() -> None:
+    test('92658374', part1('389125467', turns=10))
+    test('67384529', part1('389125467', turns=100))
+    test(149245887792, part2('389125467', turns=10000000, cups_amount=1000000))
 
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day23.txt')
-with open(file_path, 'r') as f:
-    input_data = f.read().strip()
+def read_input(file_path: str = None) -> str:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day23.txt')
+    with open(file_path, 'r') as f:
+        return f.read().strip()
 
-    print('Day 23, part 1: %r' % (part1(input_data, turns=100)))
-    print('Day 23, part 2: %r' % (part2(input_data, turns=10000000, cups_amount=1000000)))
+
+def solve_part1(input_data: str) -> str:
+    return part1(input_data, turns=100)
+
+
+def solve_part2(input_data: str) -> int:
+    return part2(input_data, turns=10000000, cups_amount=1000000)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 23, part 1: %r' % (solve_part1(input_data)))
+    print('Day 23, part 2: %r' % (solve_part2(input_data)))
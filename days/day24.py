@@ -80,36 +80,51 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test_input_data = [
-    'sesenwnenenewseeswwswswwnenewsewsw',
-    'neeenesenwnwwswnenewnwwsewnenwseswesw',
-    'seswneswswsenwwnwse',
-    'nwnwneseeswswnenewneswwnewseswneseene',
-    'swweswneswnenwsewnwneneseenw',
-    'eesenwseswswnenwswnwnwsewwnwsene',
-    'sewnenenenesenwsewnenwwwse',
-    'wenwwweseeeweswwwnwwe',
-    'wsweesenenewnwwnwsenewsenwwsesesenwne',
-    'neeswseenwwswnwswswnw',
-    'nenwswwsewswnenenewsenwsenwnesesenew',
-    'enewnwewneswsewnwswenweswnenwsenwsw',
-    'sweneswneswneneenwnewenewwneswswnese',
-    'swwesenesewenwneswnwwneseswwne',
-    'enesenwswwswneneswsenwnewswseenwsese',
-    'wnwnesenesenenwwnenwsewesewsesesew',
-    'nenewswnwewswnenesenwnesewesw',
-    'eneswnwswnwsenenwnwnwwseeswneewsenese',
-    'neswnwewnwnwseenwseesewsenwsweewe',
-    'wseweeenwnesenwwwswnew',
-]
-
-test(10, part1(test_input_data))
-test(2208, part2(test_input_data, days=100))
-
-
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day24.txt')
-with open(file_path, 'r') as f:
-    input_data = [line.strip() for line in f.readlines()]
-
-    print('Day 24, part 1: %r' % (part1(input_data)))
-    print('Day 24, part 2: %r' % (part2(input_data, days=100)))
+def run_tests() -> None:
+    test_input_data = [
+        'sesenwnenenewseeswwswswwnenewsewsw',
+        'neeenesenwnwwswnenewnwwsewnenwseswesw',
+        'seswneswswsenwwnwse',
+        'nwnwneseeswswnenewneswwnewseswneseene',
+        'swweswneswnenwsewnwneneseenw',
+        'eesenwseswswnenwswnwnwsewwnwsene',
+        'sewnenenenesenwsewnenwwwse',
+        'wenwwweseeeweswwwnwwe',
+        'wsweesenenewnwwnwsenewsenwwsesesenwne',
+        'neeswseenwwswnwswswnw',
+        'nenwswwsewswnenenewsenwsenwnesesenew',
+        'enewnwewneswsewnwswenweswnenwsenwsw',
+        'sweneswneswneneenwnewenewwneswswnese',
+        'swwesenesewenwneswnwwneseswwne',
+        'enesenwswwswneneswsenwnewswseenwsese',
+        'wnwnesenesenenwwnenwsewesewsesesew',
+        'nenewswnwewswnenesenwnesewesw',
+        'eneswnwswnwsenenwnwnwwseeswneewsenese',
+        'neswnwewnwnwseenwseesewsenwsweewe',
+        'wseweeenwnesenwwwswnew',
+    ]
+
+    test(10, part1(test_input_data))
+    test(2208, part2(test_input_data, days=100))
+
+
+def read_input(file_path: str = None) -> List[str]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day24.txt')
+    with open(file_path, 'r') as f:
+        return [line.strip() for line in f.readlines()]
+
+
+def solve_part1(input_data: List[str]) -> int:
+    return part1(input_data)
+
+
+def solve_part2(input_data: List[str]) -> int:
+    return part2(input_data, days=100)
+
+
+if __name__ == '__main__':
+    run_tests()
+
+    input_data = read_input()
+    print('Day 24, part 1: %r' % (solve_part1(input_data)))
+    print('Day 24, part 2: %r' % (solve_part2(input_data)))
@@ -1,5 +1,7 @@
 import os
 
+from typing import List
+
 
 def part1(card_public_key: int, door_public_key: int) -> int:
     card_loop_size = _reverse_loop_size(card_public_key, subject_number=7)
@@ -33,18 +35,29 @@ def test(expected, actual):
     assert expected == actual, f'Expected: {expected}, Actual: {actual}'
 
 
-test(5764801, _calculate_encryption_key(loop_size=8, subject_number=7))
-test(17807724, _calculate_encryption_key(loop_size=11, subject_number=7))
+def run_tests() -> None:
+    test(5764801, _calculate_encryption_key(loop_size=8, subject_number=7))
+    test(17807724, _calculate_encryption_key(loop_size=11, subject_number=7))
+
+    test(8, _reverse_loop_size(5764801, subject_number=7))
+    test(11, _reverse_loop_size(17807724, subject_number=7))
+
+    test(14897079, part1(card_public_key=5764801, door_public_key=17807724))
+
+
+def read_input(file_path: str = None) -> List[int]:
+    file_path = file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs/day25.txt')
+    with open(file_path, 'r') as f:
+        return [int(line.strip()) for line in f.readlines()]
 
-test(8, _reverse_loop_size(5764801, subject_number=7))
-test(11, _reverse_loop_size(17807724, subject_number=7))
 
-test(14897079, part1(card_public_key=5764801, door_public_key=17807724))
+def solve_part1(input_data: List[int]) -> int:
+    return part1(card_public_key=input_data[0], door_public_key=input_data[1])
 
 
-file_path = os.path.join(os.path.dirname(__file__), 'inputs/day25.txt')
-with open(file_path, 'r') as f:
-    input_data = [int(line.strip()) for line in f.readlines()]
+if __name__ == '__main__':
+    run_tests()
 
-    print('Day 25, part 1: %r' % (part1(card_public_key=input_data[0], door_public_key=input_data[1])))
+    input_data = read_input()
+    print('Day 25, part 1: %r' % (solve_part1(input_data)))
     print('Day 25, part 2: Free star')
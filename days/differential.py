@@ -0,0 +1,230 @@
+import random
+
+from collections import namedtuple
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from days import generators, reader, runner
+
+
+# A check runs the reference and the fast engine of a day on the same case, a list of input lines. Cases come from
+# `cases`, `shrinkers` propose smaller variants of a failing case and `valid` rejects cases the reference can not solve.
+Check = namedtuple('Check', 'day reference fast cases shrinkers valid')
+Mismatch = namedtuple('Mismatch', 'check case expected actual')
+
+DEFAULT_ITERATIONS = 100
+
+# Slopes, as (right, down), counted on every day 3 case.
+SLOPES = [(right, down) for right in range(8) for down in range(1, 4)]
+
+
+def _password_lines(rng: random.Random) -> List[str]:
+    return rng.sample(generators.generate(2, seed=rng.randrange(2 ** 32)).splitlines(), rng.randint(1, 20))
+
+
+def _passport_lines(rng: random.Random) -> List[str]:
+    records = generators.generate(4, seed=rng.randrange(2 ** 32)).split('\n\n')
+    return '\n\n'.join(rng.sample(records, rng.randint(1, 10))).splitlines()
+
+
+def _boarding_passes(rng: random.Random) -> List[str]:
+    return rng.sample(generators.generate(5, seed=rng.randrange(2 ** 32)).splitlines(), rng.randint(1, 50))
+
+
+def _answer_lines(rng: random.Random) -> List[str]:
+    groups = generators.generate(6, seed=rng.randrange(2 ** 32)).split('\n\n')
+    return '\n\n'.join(rng.sample(groups, rng.randint(1, 10))).splitlines()
+
+
+def _bag_rules(rng: random.Random) -> List[str]:
+    return rng.sample(generators.generate(7, seed=rng.randrange(2 ** 32)).splitlines(), rng.randint(1, 60))
+
+
+def _tree_maps(rng: random.Random) -> List[str]:
+    lines = generators.generate(3, seed=rng.randrange(2 ** 32)).splitlines()
+    width = rng.randint(1, 31)
+    return [line[:width] for line in lines[:rng.randint(1, 40)]]
+
+
+def _seat_layouts(rng: random.Random) -> List[str]:
+    return generators.seat_layout(rng, rng.randint(1, 12), rng.randint(1, 12))
+
+
+def _expressions(rng: random.Random) -> List[str]:
+    return rng.sample(generators.generate(18, seed=rng.randrange(2 ** 32)).splitlines(), rng.randint(1, 5))
+
+
+def _drop_lines(case: List[str]) -> Iterator[List[str]]:
+    size = len(case) // 2
+    while size > 0:
+        for i in range(0, len(case), size):
+            yield case[:i] + case[i + size:]
+        size //= 2
+
+
+def _drop_columns(case: List[str]) -> Iterator[List[str]]:
+    width = len(case[0]) if case else 0
+    for x in range(width):
+        yield [line[:x] + line[x + 1:] for line in case]
+
+
+def _settles(case: List[str]) -> bool:
+    return not generators.blinking_seats(case)
+
+
+def _walk_slopes(module: ModuleType, case: List[str]) -> List[int]:
+    grid = module.TreeGrid(case)
+    return [module._walk_slope(grid, module.SlopeRule(*slope)) for slope in SLOPES]
+
+
+def _count_slopes(module: ModuleType, case: List[str]) -> List[int]:
+    return module.TreeGrid(case).count_trees([module.SlopeRule(*slope) for slope in SLOPES])
+
+
+def _answer_counts(module: ModuleType, case: List[str]) -> List[int]:
+    text = '\n'.join(case)
+    groups = list(module._read_groups(reader.split_records(case)))
+    return [module._count_anyone(text), module._count_everyone(text)] + [module.count_answers(groups, k)[2]
+                                                                         for k in range(2, 5)]
+
+
+def _answer_histograms(module: ModuleType, case: List[str]) -> List[int]:
+    histograms = module.AnswerHistograms(reader.split_records(case))
+    return [histograms.at_least(1), histograms.at_least_share(100)] + [histograms.at_least(k) for k in range(2, 5)]
+
+
+def _inner_dfs_counts(module: ModuleType, case: List[str]) -> Dict[str, int]:
+    grid = module._parse_rules(case)
+    return {color: module._inner_dfs(color, grid) for color in grid}
+
+
+def _outer_dfs_counts(module: ModuleType, case: List[str]) -> Dict[str, int]:
+    grid = module._parse_rules(case)
+    return {color: module._outer_dfs(color, grid, set()) for color in grid}
+
+
+def _index_counts(module: ModuleType, case: List[str]) -> Dict[str, int]:
+    grid = module._parse_rules(case)
+    index = module.BagIndex(grid)
+    return {color: index.containers(color) for color in grid}
+
+
+def _fresh_bag_queries(module: ModuleType, case: List[str]) -> List[Tuple[int, Dict[str, Tuple[int, int]]]]:
+    results = []
+    for rules in [case, case[1::2]]:
+        grid = module._parse_rules(rules)
+        index, counts = module.BagIndex(grid), module.inner_bag_counts(grid)
+        results.append((len(grid), {color: (index.containers(color), counts[color]) for color in grid}))
+    return results
+
+
+def _edited_bag_queries(module: ModuleType, case: List[str]) -> List[Tuple[int, Dict[str, Tuple[int, int]]]]:
+    # Every other rule is removed and added back after the graph is built, so the cached values go through edits, and
+    # removed once more to compare the colors left over to a graph of the remaining rules.
+    graph = module.BagGraph(case)
+    removed = [module._parse_rule(line)[0] for line in case[::2]]
+    for color in removed:
+        graph.remove_rule(color)
+    for line in case[::2]:
+        graph.set_rule(line)
+
+    results = [_graph_queries(graph)]
+    for color in removed:
+        graph.remove_rule(color)
+    return results + [_graph_queries(graph)]
+
+
+def _graph_queries(graph: Any) -> Tuple[int, Dict[str, Tuple[int, int]]]:
+    return len(graph), {color: (graph.containers(color), graph.contents(color)) for color in graph}
+
+
+def _count_passports(module: ModuleType, case: List[str]) -> Tuple[int, int]:
+    return module.count_passports(module._read_passports(reader.split_records(case)))
+
+
+def _count_columns(module: ModuleType, case: List[str]) -> Tuple[int, int]:
+    columns = module._parse_columns('\n'.join(case).encode())
+    return module._count_by_occurrences(columns), module._count_by_positions(columns)
+
+
+CHECKS = {
+    'day03.slopes': Check(3, _walk_slopes, _count_slopes, _tree_maps, [_drop_lines, _drop_columns], None),
+    'day02.columns': Check(2, lambda m, case: (m.part1(case), m.part2(case)), _count_columns,
+                           _password_lines, [_drop_lines], None),
+    'day04.passports': Check(4, lambda m, case: (m._count_present('\n'.join(case)), m._count_valid('\n'.join(case))),
+                             _count_passports, _passport_lines, [_drop_lines], None),
+    'day05.seats': Check(5, lambda m, case: [row * 8 + column for row, column in map(m._calculate_seat, case)],
+                         lambda m, case: list(m.decode_seats('\n'.join(case).encode())),
+                         _boarding_passes, [_drop_lines], None),
+    'day06.answers': Check(6, lambda m, case: (m._count_anyone('\n'.join(case)), m._count_everyone('\n'.join(case))),
+                           lambda m, case: m.count_answers(m._read_groups(reader.split_records(case)))[:2],
+                           _answer_lines, [_drop_lines], None),
+    'day06.histograms': Check(6, _answer_counts, _answer_histograms, _answer_lines, [_drop_lines], None),
+    'day07.inner': Check(7, _inner_dfs_counts, lambda m, case: m.inner_bag_counts(m._parse_rules(case)),
+                         _bag_rules, [_drop_lines], None),
+    'day07.outer': Check(7, _outer_dfs_counts, _index_counts, _bag_rules, [_drop_lines], None),
+    'day07.graph': Check(7, _fresh_bag_queries, _edited_bag_queries, _bag_rules, [_drop_lines], None),
+    'day11.part1': Check(11, lambda m, case: m._calculate_seats(case, 1), lambda m, case: m._settle_seats(case, 1),
+                         _seat_layouts, [_drop_lines, _drop_columns], _settles),
+    'day11.part2': Check(11, lambda m, case: m._calculate_seats(case, 2), lambda m, case: m._settle_seats(case, 2),
+                         _seat_layouts, [_drop_lines, _drop_columns], _settles),
+    'day18.part1': Check(18, lambda m, case: [m._calculator_equal_precedence(e) for e in case],
+                         lambda m, case: [m._evaluate(e, m.EQUAL_PRECEDENCE) for e in case],
+                         _expressions, [_drop_lines], None),
+    'day18.part2': Check(18, lambda m, case: [m._calculator_additions_first(e) for e in case],
+                         lambda m, case: [m._evaluate(e, m.ADDITIONS_FIRST) for e in case],
+                         _expressions, [_drop_lines], None),
+}
+
+
+def run_check(name: str, iterations: int = DEFAULT_ITERATIONS,
+              seed: int = generators.DEFAULT_SEED) -> Optional[Mismatch]:
+    check = CHECKS[name]
+    module = runner.load_day(check.day)
+    rng = random.Random(f'{seed}-{name}')
+
+    for _ in range(iterations):
+        case = check.cases(rng)
+        if _fails(check, module, case):
+            case = shrink(check, module, case)
+            return Mismatch(name, case, _outcome(check.reference, module, case), _outcome(check.fast, module, case))
+
+    return None
+
+
+def shrink(check: Check, module: ModuleType, case: List[str]) -> List[str]:
+    # Greedy delta debugging: keep taking the first smaller variant which still fails until none does.
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        for shrinker in check.shrinkers:
+            for candidate in shrinker(case):
+                if _fails(check, module, candidate):
+                    case, shrunk = candidate, True
+                    break
+            if shrunk:
+                break
+
+    return case
+
+
+def _fails(check: Check, module: ModuleType, case: List[str]) -> bool:
+    if check.valid and not check.valid(case):
+        return False
+
+    try:
+        expected = check.reference(module, case)
+    except Exception:
+        return False
+
+    try:
+        return check.fast(module, case) != expected
+    except Exception:
+        return True
+
+
+def _outcome(engine: Callable[[ModuleType, List[str]], Any], module: ModuleType, case: List[str]) -> Any:
+    try:
+        return engine(module, case)
+    except Exception as e:
+        return f'{type(e).__name__}: {e}'
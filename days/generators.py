@@ -0,0 +1,649 @@
+import json
+import math
+import os
+import random
+import string
+
+from typing import Dict, List, Tuple
+
+from days import day11, runner
+
+
+# Scale 1 produces inputs of roughly the same size as the bundled puzzle inputs. Days whose input size is fixed by
+# the puzzle format (05, 15, 23, 25), bounded by it (09, 20) or by the cost of the solver (22) ignore or cap the scale
+# factor, see the generators below.
+DEFAULT_SEED = 2020
+
+SYLLABLES = [c + v for c in 'bcdfghjklmnprstvz' for v in 'aeiou']
+ALLERGENS = ['dairy', 'eggs', 'fish', 'nuts', 'peanuts', 'sesame', 'shellfish', 'soy', 'wheat']
+TICKET_FIELDS = [
+    'departure location', 'departure station', 'departure platform', 'departure track', 'departure date',
+    'departure time', 'arrival location', 'arrival station', 'arrival platform', 'arrival track', 'class',
+    'duration', 'price', 'route', 'row', 'seat', 'train', 'type', 'wagon', 'zone',
+]
+SEA_MONSTER = [
+    '                  # ',
+    '#    ##    ##    ###',
+    ' #  #  #  #  #  #   ',
+]
+
+
+def generate(day: int, scale: int = 1, seed: int = DEFAULT_SEED) -> str:
+    if day not in GENERATORS:
+        raise ValueError(f'Unknown day: {day}. Expected one of 1..{runner.DAYS[-1]}.')
+    if scale < 1:
+        raise ValueError(f'Scale should be a positive integer, got: {scale}.')
+
+    rng = random.Random(f'{seed}-{day}')
+    return GENERATORS[day](rng, scale)
+
+
+def write_inputs(output_dir: str, days: List[int] = None, scale: int = 1, seed: int = DEFAULT_SEED,
+                 answers: bool = True) -> Dict[str, Dict[str, object]]:
+    os.makedirs(output_dir, exist_ok=True)
+    solved = {}
+
+    for day in days if days else runner.DAYS:
+        file_path = os.path.join(output_dir, f'day{day:02d}.txt')
+        with open(file_path, 'w') as f:
+            f.write(generate(day, scale=scale, seed=seed))
+
+        if answers:
+            solved[f'{day:02d}'] = {
+                str(part): runner.run_part(day, part, file_path=file_path) for part in runner.available_parts(day)
+            }
+
+    if answers:
+        with open(os.path.join(output_dir, 'answers.json'), 'w') as f:
+            json.dump({'scale': scale, 'seed': seed, 'answers': solved}, f, indent=2)
+            f.write('\n')
+
+    return solved
+
+
+def _word(rng: random.Random, syllables: int) -> str:
+    return ''.join(rng.choice(SYLLABLES) for _ in range(syllables))
+
+
+def _unique_words(rng: random.Random, amount: int) -> List[str]:
+    words = set()
+    result = []
+
+    syllables = 2
+    while len(SYLLABLES) ** syllables < 4 * amount:
+        syllables += 1
+
+    while len(result) < amount:
+        word = _word(rng, syllables)
+        if word not in words:
+            words.add(word)
+            result.append(word)
+
+    return result
+
+
+def _lines(lines: List[str]) -> str:
+    return '\n'.join(lines) + '\n'
+
+
+def _day01(rng: random.Random, scale: int) -> str:
+    # Fillers are above 2020, so the planted pair and triple are the only entries that can sum up to 2020.
+    while True:
+        a = rng.randint(1, 1009)
+        x = rng.randint(1, 672)
+        y = rng.randint(x + 1, 1009 - x // 2)
+        planted = [a, 2020 - a, x, y, 2020 - x - y]
+        pairs = [p for p in _combinations(planted, 2) if sum(p) == 2020]
+        triples = [t for t in _combinations(planted, 3) if sum(t) == 2020]
+        if len(set(planted)) == 5 and len(pairs) == 1 and len(triples) == 1:
+            break
+
+    nums = [rng.randint(2021, 1000000) for _ in range(200 * scale - len(planted))] + planted
+    rng.shuffle(nums)
+    return _lines([str(num) for num in nums])
+
+
+def _combinations(items: List[int], k: int) -> List[Tuple[int, ...]]:
+    if k == 0:
+        return [()]
+    return [(items[i], *rest) for i in range(len(items)) for rest in _combinations(items[i + 1:], k - 1)]
+
+
+def _day02(rng: random.Random, scale: int) -> str:
+    lines = []
+
+    for _ in range(1000 * scale):
+        min_ = rng.randint(1, 10)
+        max_ = rng.randint(min_ + 1, min_ + 10)
+        symbol = rng.choice(string.ascii_lowercase)
+        alphabet = symbol * 4 + ''.join(rng.sample(string.ascii_lowercase, 6))
+        password = ''.join(rng.choice(alphabet) for _ in range(rng.randint(max(2, min_), max_ + 4)))
+        lines.append(f'{min_}-{max_} {symbol}: {password}')
+
+    return _lines(lines)
+
+
+def _day03(rng: random.Random, scale: int) -> str:
+    return _lines([''.join('#' if rng.random() < 0.25 else '.' for _ in range(31)) for _ in range(323 * scale)])
+
+
+def _day04(rng: random.Random, scale: int) -> str:
+    hex_digits = '0123456789abcdef'
+    valid = {
+        'byr': lambda: str(rng.randint(1920, 2002)),
+        'iyr': lambda: str(rng.randint(2010, 2020)),
+        'eyr': lambda: str(rng.randint(2020, 2030)),
+        'hgt': lambda: rng.choice([f'{rng.randint(150, 193)}cm', f'{rng.randint(59, 76)}in']),
+        'hcl': lambda: '#' + ''.join(rng.choice(hex_digits) for _ in range(6)),
+        'ecl': lambda: rng.choice(['amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth']),
+        'pid': lambda: ''.join(rng.choice(string.digits) for _ in range(9)),
+        'cid': lambda: str(rng.randint(50, 350)),
+    }
+    invalid = {
+        'byr': lambda: str(rng.choice([rng.randint(1900, 1919), rng.randint(2003, 2030)])),
+        'iyr': lambda: str(rng.choice([rng.randint(2000, 2009), rng.randint(2021, 2030)])),
+        'eyr': lambda: str(rng.choice([rng.randint(2000, 2019), rng.randint(2031, 2040)])),
+        'hgt': lambda: rng.choice([f'{rng.randint(100, 149)}cm', f'{rng.randint(77, 99)}in',
+                                   str(rng.randint(59, 193))]),
+        'hcl': lambda: rng.choice(['#', '']) + ''.join(rng.choice(hex_digits + 'xyz') for _ in range(6)),
+        'ecl': lambda: rng.choice(['xry', 'zzz', 'gmt', 'utc']),
+        'pid': lambda: ''.join(rng.choice(string.digits) for _ in range(rng.choice([8, 10]))),
+    }
+    passports = []
+
+    for _ in range(250 * scale):
+        fields = {field: generate_value() for field, generate_value in valid.items()}
+        if rng.random() < 0.3:
+            del fields['cid']
+        if rng.random() < 0.2:
+            del fields[rng.choice(list(invalid.keys()))]
+        if rng.random() < 0.3:
+            field = rng.choice([field for field in invalid.keys() if field in fields])
+            fields[field] = invalid[field]()
+
+        items = [f'{field}:{value}' for field, value in fields.items()]
+        rng.shuffle(items)
+        passport = items[0]
+        for item in items[1:]:
+            passport += rng.choice([' ', ' ', '\n']) + item
+        passports.append(passport)
+
+    return '\n\n'.join(passports) + '\n'
+
+
+def _day05(rng: random.Random, scale: int) -> str:
+    # Boarding passes are always 10 characters, so the plane never has more than 1024 seats: the scale is capped.
+    amount = min(800 * scale, 1000)
+    first = rng.randint(1, 1022 - amount)
+    seat_ids = list(range(first, first + amount + 1))
+    seat_ids.remove(rng.randint(first + 1, first + amount - 1))
+    rng.shuffle(seat_ids)
+
+    rows, columns = str.maketrans('01', 'FB'), str.maketrans('01', 'LR')
+    return _lines([format(seat_id >> 3, '07b').translate(rows) + format(seat_id & 7, '03b').translate(columns)
+                   for seat_id in seat_ids])
+
+
+def _day06(rng: random.Random, scale: int) -> str:
+    groups = []
+
+    for _ in range(500 * scale):
+        common = rng.sample(string.ascii_lowercase, rng.randint(0, 6))
+        people = []
+        for _ in range(rng.randint(1, 5)):
+            own = rng.sample(string.ascii_lowercase, rng.randint(0, 6))
+            answers = sorted(set(common + own))
+            rng.shuffle(answers)
+            people.append(''.join(answers) if answers else rng.choice(string.ascii_lowercase))
+        groups.append('\n'.join(people))
+
+    return '\n\n'.join(groups) + '\n'
+
+
+def _day07(rng: random.Random, scale: int) -> str:
+    # Colors are layered and rules only point to deeper layers, so the bag graph is a DAG of bounded depth.
+    levels = 9
+    words = _unique_words(rng, 600 * scale)
+    colors = [f'{rng.choice(words)} {word}' for word in words[1:]]
+    rng.shuffle(colors)
+    layers = [colors[i::levels] for i in range(levels)]
+    layers[levels // 2].append('shiny gold')
+
+    contents = {}
+    for level, layer in enumerate(layers):
+        for color in layer:
+            contents[color] = set()
+            if level == levels - 1 or color != 'shiny gold' and rng.random() < 0.1:
+                continue
+            for _ in range(rng.randint(1, 4)):
+                contents[color].add(rng.choice(layers[rng.randint(level + 1, min(level + 2, levels - 1))]))
+
+    for color in rng.sample(layers[levels // 2 - 1], 3):
+        contents[color].add('shiny gold')
+
+    lines = []
+    for color, inner in contents.items():
+        bags = []
+        for inner_color in sorted(inner):
+            amount = rng.randint(1, 5)
+            bags.append(f'{amount} {inner_color} bag{"s" if amount > 1 else ""}')
+        lines.append(f'{color} bags contain {", ".join(bags) if bags else "no other bags"}.')
+
+    rng.shuffle(lines)
+    return _lines(lines)
+
+
+def _day08(rng: random.Random, scale: int) -> str:
+    # The executed path runs forward, skipping dead blocks with "jmp", until a single backward "jmp" loops it. Only
+    # turning that instruction into a "nop" lets the program reach the terminating tail.
+    path_length, tail_length = 500 * scale, 100 * scale
+    program = []
+    path = []
+
+    while len(path) < path_length:
+        position = len(program)
+        if rng.random() < 0.1:
+            dead_block = rng.randint(1, 5)
+            program.append(f'jmp +{dead_block + 1}')
+            path.append(position)
+            for _ in range(dead_block - 1):
+                program.append(f'acc {rng.randint(-50, 50):+d}')
+            program.append(f'jmp {-rng.randint(1, position + 1):+d}')
+            continue
+
+        if rng.random() < 0.3 and position > 0:
+            program.append(f'nop {-rng.randint(0, position):+d}')
+        else:
+            program.append(f'acc {rng.randint(-50, 50):+d}')
+        path.append(position)
+
+    program.append(f'jmp {-rng.randint(1, len(program)):+d}')
+    program += [f'acc {rng.randint(-50, 50):+d}' for _ in range(tail_length)]
+
+    return _lines(program)
+
+
+def _day09(rng: random.Random, scale: int) -> str:
+    # Every valid number is a sum of two numbers from the previous 25, so values double about every 25 numbers. The
+    # valid prefix keeps the puzzle length, the rest of the scaled input is filler with the planted contiguous range.
+    preamble = 25
+    nums = rng.sample(range(1, 100), preamble)
+
+    while len(nums) < 1000:
+        # Summing the smallest numbers of the window keeps the growth close to the puzzle input.
+        a, b = rng.sample(sorted(nums[-preamble:])[:6], 2)
+        nums.append(a + b)
+
+    window = set(nums[-preamble:])
+    invalid = rng.randint(max(nums[-preamble:]), 2 * max(nums[-preamble:]))
+    while any(invalid - v in window for v in window):
+        invalid += 1
+    nums.append(invalid)
+
+    filler = [rng.randint(1, 1000) for _ in range(1000 * (scale - 1))]
+    parts = rng.randint(3, 10)
+    cuts = sorted(rng.sample(range(1, invalid), parts - 1))
+    contiguous = [b - a for a, b in zip([0] + cuts, cuts + [invalid])]
+    position = rng.randint(0, len(filler))
+
+    return _lines([str(num) for num in nums + filler[:position] + contiguous + filler[position:]])
+
+
+def _day10(rng: random.Random, scale: int) -> str:
+    adapters = []
+    current = 0
+
+    for _ in range(100 * scale):
+        current += 1 if rng.random() < 0.7 else 3
+        adapters.append(current)
+
+    rng.shuffle(adapters)
+    return _lines([str(adapter) for adapter in adapters])
+
+
+def _day11(rng: random.Random, scale: int) -> str:
+    width = 90 * max(1, int(math.sqrt(scale)))
+    height = 98 * scale // max(1, int(math.sqrt(scale)))
+    return _lines(seat_layout(rng, width, height))
+
+
+def seat_layout(rng: random.Random, width: int, height: int) -> List[str]:
+    # Random layouts may contain blocks of seats that blink forever, which the solvers never leave. Such seats are
+    # turned into floor until the layout settles under both sets of rules.
+    seats = [['L' if rng.random() < 0.8 else '.' for _ in range(width)] for _ in range(height)]
+
+    while True:
+        blinking = blinking_seats(seats)
+        if not blinking:
+            return [''.join(row) for row in seats]
+
+        for y, x in rng.sample(blinking, max(1, len(blinking) // 10)):
+            seats[y][x] = '.'
+
+
+def blinking_seats(seats: List[List[str]]) -> List[Tuple[int, int]]:
+    return _blinking_seats(seats, visible=False, tolerance=4) or _blinking_seats(seats, visible=True, tolerance=5)
+
+
+def _blinking_seats(seats: List[List[str]], visible: bool, tolerance: int) -> List[Tuple[int, int]]:
+    # The seats are flipped by the engine of day 11, starting from all empty; a round flipping the same seats as the
+    # previous one has the seats blinking.
+    positions, neighbors = day11._seat_neighbors(seats, visible)
+    occupied, previous_flips = [False] * len(positions), None
+
+    for flips in day11._flip_rounds(neighbors, occupied, tolerance):
+        flips = sorted(flips)
+        if flips == previous_flips:
+            return [positions[i] for i in flips]
+        previous_flips = flips
+
+    return []
+
+
+def _day12(rng: random.Random, scale: int) -> str:
+    actions = []
+
+    for _ in range(780 * scale):
+        action = rng.choice('NSEWLRFFF')
+        value = rng.choice([90, 90, 180, 270]) if action in 'LR' else rng.randint(1, 100)
+        actions.append(f'{action}{value}')
+
+    return _lines(actions)
+
+
+def _day13(rng: random.Random, scale: int) -> str:
+    # Part 2 relies on the Chinese remainder theorem, so bus ids are distinct primes.
+    buses = 9 * scale
+    primes = _primes(max(1000, int(buses * math.log(buses + 2) * 3)))
+    bus_ids = rng.sample([p for p in primes if p > 10], buses)
+    schedule = ['x'] * (buses * 7)
+
+    for bus_id, position in zip(bus_ids, [0] + rng.sample(range(1, len(schedule)), buses - 1)):
+        schedule[position] = str(bus_id)
+
+    return _lines([str(rng.randint(1000000, 1010000)), ','.join(schedule)])
+
+
+def _primes(limit: int) -> List[int]:
+    sieve = [True] * (limit + 1)
+    sieve[0] = sieve[1] = False
+
+    for i in range(2, int(math.sqrt(limit)) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = [False] * len(sieve[i * i::i])
+
+    return [i for i, is_prime in enumerate(sieve) if is_prime]
+
+
+def _day14(rng: random.Random, scale: int) -> str:
+    lines = []
+
+    for _ in range(150 * scale):
+        floating = set(rng.sample(range(36), rng.randint(3, 9)))
+        mask = ''.join('X' if i in floating else rng.choice('01') for i in range(36))
+        lines.append(f'mask = {mask}')
+        for _ in range(rng.randint(1, 6)):
+            lines.append(f'mem[{rng.randint(1, 65535)}] = {rng.randint(1, 2 ** 30)}')
+
+    return _lines(lines)
+
+
+def _day15(rng: random.Random, scale: int) -> str:
+    # The amount of turns is fixed by the puzzle, not by the input, so the scale does not apply.
+    return _lines([','.join(str(num) for num in rng.sample(range(0, 21), rng.randint(6, 7)))])
+
+
+def _day16(rng: random.Random, scale: int) -> str:
+    # The rule of rank r is valid for the value bands of all ranks >= r, so valid tickets give nested candidate
+    # position sets and the field assignment is unique.
+    fields = len(TICKET_FIELDS)
+    ranks = list(range(fields))
+    rng.shuffle(ranks)
+    rules = []
+
+    for rank, name in zip(rng.sample(range(fields), fields), TICKET_FIELDS):
+        rules.append((rank, f'{name}: {100 + 10 * rank}-299 or {400 + rng.randint(0, 10)}-{rng.randint(440, 450)}'))
+
+    def valid_value(position: int) -> int:
+        rank = ranks[position]
+        return rng.randint(100 + 10 * rank, 109 + 10 * rank) if rng.random() < 0.9 else rng.randint(410, 440)
+
+    def invalid_value() -> int:
+        return rng.choice([rng.randint(0, 99), rng.randint(300, 399), rng.randint(451, 999)])
+
+    # The first nearby tickets pin down every position to its own band.
+    nearby = [[100 + 10 * ranks[position] + rng.randint(0, 9) for position in range(fields)] for _ in range(2)]
+    for _ in range(240 * scale - len(nearby)):
+        ticket = [valid_value(position) for position in range(fields)]
+        if rng.random() < 0.25:
+            ticket[rng.randrange(fields)] = invalid_value()
+        nearby.append(ticket)
+    rng.shuffle(nearby)
+
+    lines = [rule for _, rule in rules]
+    lines += ['', 'your ticket:', ','.join(str(valid_value(position)) for position in range(fields))]
+    lines += ['', 'nearby tickets:'] + [','.join(str(v) for v in ticket) for ticket in nearby]
+    return _lines(lines)
+
+
+def _day17(rng: random.Random, scale: int) -> str:
+    size = max(8, int(8 * math.sqrt(scale)))
+    return _lines([''.join('#' if rng.random() < 0.45 else '.' for _ in range(size)) for _ in range(size)])
+
+
+def _day18(rng: random.Random, scale: int) -> str:
+    def expression(depth: int) -> str:
+        operands = []
+        for _ in range(rng.randint(2, 5)):
+            if depth < 2 and rng.random() < 0.2:
+                operands.append(f'({expression(depth + 1)})')
+            else:
+                operands.append(str(rng.randint(1, 9)))
+
+        result = operands[0]
+        for operand in operands[1:]:
+            result += f' {rng.choice("+*")} {operand}'
+        return result
+
+    return _lines([expression(0) for _ in range(370 * scale)])
+
+
+def _day19(rng: random.Random, scale: int) -> str:
+    # A leveled grammar: level k rules are two alternatives of two level k-1 rules, so rules 42 and 31 on the top
+    # level match words of length 8 and messages are built from them as 0: 8 11, 8: 42, 11: 42 31.
+    ids = rng.sample([i for i in range(1, 140) if i not in (8, 11, 31, 42)], 12)
+    a, b = ids.pop(), ids.pop()
+    rules = {a: '"a"', b: '"b"'}
+    alternatives = {a: [[a]], b: [[b]]}
+    level = [a, b]
+
+    for size in [4, 6]:
+        next_level = [ids.pop() for _ in range(size)]
+        for rule_id in next_level:
+            alternatives[rule_id] = [[rng.choice(level), rng.choice(level)] for _ in range(2)]
+        level = next_level
+
+    for rule_id in [42, 31]:
+        alternatives[rule_id] = [[rng.choice(level), rng.choice(level)] for _ in range(2)]
+    alternatives[0], alternatives[8], alternatives[11] = [[8, 11]], [[42]], [[42, 31]]
+
+    for rule_id, alts in alternatives.items():
+        if rule_id not in rules:
+            rules[rule_id] = ' | '.join(' '.join(str(r) for r in alt) for alt in alts)
+
+    def message(rule_id: int) -> str:
+        if rule_id in (a, b):
+            return 'a' if rule_id == a else 'b'
+        return ''.join(message(r) for r in rng.choice(alternatives[rule_id]))
+
+    messages = []
+    for _ in range(400 * scale):
+        kind = rng.random()
+        if kind < 0.3:
+            words = [42, 42, 31]
+        elif kind < 0.6:
+            m = rng.randint(1, 4)
+            words = [42] * (m + rng.randint(1, 3)) + [31] * m
+        else:
+            words = [rng.choice([42, 31]) for _ in range(rng.randint(2, 8))]
+        text = ''.join(message(word) for word in words)
+        if rng.random() < 0.1:
+            text += rng.choice('ab')
+        messages.append(text)
+
+    rule_lines = [f'{rule_id}: {rule}' for rule_id, rule in rules.items()]
+    rng.shuffle(rule_lines)
+    return _lines(rule_lines + [''] + messages)
+
+
+def _day20(rng: random.Random, scale: int) -> str:
+    # Tile ids are parsed as 4 digits, so the amount of tiles is capped at 94 x 94. Borders are unique up to a flip,
+    # which keeps corners the only tiles with exactly two neighbours; the tile size grows to make room for them.
+    side = min(94, max(3, int(12 * math.sqrt(scale))))
+    size = 10
+    while 2 ** size < 4 * side * (side + 1):
+        size += 1
+    inner = size - 2
+
+    image = [[1 if rng.random() < 0.3 else 0 for _ in range(side * inner)] for _ in range(side * inner)]
+    monster = [(y, x) for y, line in enumerate(SEA_MONSTER) for x, ch in enumerate(line) if ch == '#']
+    for _ in range(max(1, side * side // 4)):
+        y0, x0 = rng.randint(0, side * inner - 3), rng.randint(0, side * inner - 20)
+        for dy, dx in monster:
+            image[y0 + dy][x0 + dx] = 1
+
+    # The full picture has one shared border line between neighbouring tiles.
+    full = side * (size - 1) + 1
+    pixels = [[0] * full for _ in range(full)]
+    for y in range(side * inner):
+        for x in range(side * inner):
+            pixels[y + y // inner + 1][x + x // inner + 1] = image[y][x]
+
+    for y in range(0, full, size - 1):
+        for x in range(0, full, size - 1):
+            pixels[y][x] = rng.randint(0, 1)
+
+    seen = set()
+    segments = [(True, y, x) for y in range(0, full, size - 1) for x in range(0, full - 1, size - 1)]
+    segments += [(False, y, x) for y in range(0, full - 1, size - 1) for x in range(0, full, size - 1)]
+
+    for horizontal, y, x in segments:
+        while True:
+            for i in range(1, size - 1):
+                pixels[y if horizontal else y + i][x + i if horizontal else x] = rng.randint(0, 1)
+            line = [pixels[y if horizontal else y + i][x + i if horizontal else x] for i in range(size)]
+            key = min(tuple(line), tuple(line[::-1]))
+            if key not in seen and line != line[::-1]:
+                seen.add(key)
+                break
+
+    tile_ids = rng.sample(range(1000, 10000), side * side)
+    tiles = []
+    for n, tile_id in enumerate(tile_ids):
+        y0, x0 = n // side * (size - 1), n % side * (size - 1)
+        tile = [pixels[y][x0:x0 + size] for y in range(y0, y0 + size)]
+        for _ in range(rng.randint(0, 3)):
+            tile = [list(row) for row in zip(*tile[::-1])]
+        if rng.random() < 0.5:
+            tile = tile[::-1]
+        tiles.append(f'Tile {tile_id}:\n' + '\n'.join(''.join('#' if v else '.' for v in row) for row in tile))
+
+    rng.shuffle(tiles)
+    return '\n\n'.join(tiles) + '\n'
+
+
+def _day21(rng: random.Random, scale: int) -> str:
+    allergens = rng.sample(ALLERGENS, 8)
+    ingredients = _unique_words(rng, 200 * scale)
+    dangerous = dict(zip(allergens, ingredients))
+    safe = ingredients[len(allergens):]
+    foods = []
+
+    def food(listed: List[str]) -> str:
+        items = set(rng.sample(safe, rng.randint(10, 40)))
+        items.update(dangerous[allergen] for allergen in listed)
+        items.update(rng.sample(list(dangerous.values()), rng.randint(0, 3)))
+        items = sorted(items)
+        rng.shuffle(items)
+        return f'{" ".join(items)} (contains {", ".join(listed)})'
+
+    for _ in range(40 * scale):
+        foods.append(food(rng.sample(allergens, rng.randint(1, 3))))
+
+    # Keep adding foods until every allergen resolves to a single ingredient by elimination.
+    while not _allergens_resolve(foods):
+        foods.append(food([rng.choice(allergens)]))
+
+    rng.shuffle(foods)
+    return _lines(foods)
+
+
+def _allergens_resolve(foods: List[str]) -> bool:
+    candidates = {}
+
+    for line in foods:
+        items, listed = line[:-1].split(' (contains ')
+        for allergen in listed.split(', '):
+            candidates[allergen] = candidates.get(allergen, set(items.split())) & set(items.split())
+
+    resolved = set()
+    while len(resolved) < len(candidates):
+        singles = [a for a, c in candidates.items() if a not in resolved and len(c) == 1]
+        if not singles:
+            return False
+        for allergen in singles:
+            resolved.add(allergen)
+            for other in candidates:
+                if other != allergen:
+                    candidates[other] -= candidates[allergen]
+
+    return True
+
+
+def _day22(rng: random.Random, scale: int) -> str:
+    # Recursive Combat of part 2 grows exponentially with the deck: random decks of 70 cards already run for minutes,
+    # so the scale is capped at the 50 cards of the puzzle input.
+    cards = 50
+
+    while True:
+        deck = rng.sample(range(1, cards + 1), cards)
+        if _combat_terminates(deck[:cards // 2], deck[cards // 2:], max_rounds=100000):
+            break
+
+    return _lines(['Player 1:'] + [str(c) for c in deck[:cards // 2]] + ['', 'Player 2:'] +
+                  [str(c) for c in deck[cards // 2:]])
+
+
+def _combat_terminates(player1: List[int], player2: List[int], max_rounds: int) -> bool:
+    player1, player2 = list(player1), list(player2)
+
+    for _ in range(max_rounds):
+        if not player1 or not player2:
+            return True
+        num1, num2 = player1.pop(0), player2.pop(0)
+        winner = player1 if num1 > num2 else player2
+        winner += [max(num1, num2), min(num1, num2)]
+
+    return False
+
+
+def _day23(rng: random.Random, scale: int) -> str:
+    # The cups are always the digits 1-9, the scale of part 2 comes from the solver arguments.
+    return _lines([''.join(str(cup) for cup in rng.sample(range(1, 10), 9))])
+
+
+def _day24(rng: random.Random, scale: int) -> str:
+    directions = ['e', 'se', 'sw', 'w', 'nw', 'ne']
+    return _lines([''.join(rng.choice(directions) for _ in range(rng.randint(14, 26))) for _ in range(400 * scale)])
+
+
+def _day25(rng: random.Random, scale: int) -> str:
+    # The loop sizes are bounded by the modulus of the handshake, so the scale does not apply.
+    return _lines([str(pow(7, rng.randint(100000, 20000000), 20201227)) for _ in range(2)])
+
+
+GENERATORS = {
+    1: _day01, 2: _day02, 3: _day03, 4: _day04, 5: _day05, 6: _day06, 7: _day07, 8: _day08, 9: _day09,
+    10: _day10, 11: _day11, 12: _day12, 13: _day13, 14: _day14, 15: _day15, 16: _day16, 17: _day17, 18: _day18,
+    19: _day19, 20: _day20, 21: _day21, 22: _day22, 23: _day23, 24: _day24, 25: _day25,
+}
@@ -0,0 +1,56 @@
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+
+from typing import Any, List, Tuple
+
+from days import runner
+
+
+def profile_cpu(day: int, part: int, output_path: str, file_path: str = None, top: int = 20) -> Tuple[Any, List[str]]:
+    solver = runner.get_solver(day, part)
+    input_data = runner.input_for(day, part, file_path)
+
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(solver, input_data)
+    profiler.dump_stats(output_path)
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return answer, stream.getvalue().strip('\n').split('\n')
+
+
+def profile_memory(day: int, part: int, output_path: str, file_path: str = None,
+                   top: int = 20) -> Tuple[Any, List[str]]:
+    module = runner.load_day(day)
+    solver = runner.get_solver(day, part)
+    input_data = runner.input_for(day, part, file_path)
+    largest = {'size': 0, 'snapshot': None}
+
+    # Temporaries are gone once the solver returns, so the heap is snapshotted whenever a function of the day module
+    # returns with noticeably more traced memory than the largest snapshot so far: its locals are still alive there.
+    def on_event(frame, event, _):
+        if event == 'return' and frame.f_code.co_filename == module.__file__:
+            current, _ = tracemalloc.get_traced_memory()
+            if current > largest['size'] * 1.1:
+                largest['size'], largest['snapshot'] = current, tracemalloc.take_snapshot()
+
+    tracemalloc.start()
+    sys.setprofile(on_event)
+    try:
+        answer = solver(input_data)
+    finally:
+        sys.setprofile(None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    snapshot = largest['snapshot'].filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    snapshot.dump(output_path)
+
+    lines = [f'Peak traced memory: {peak / 1024:.1f} KiB',
+             f'Top {top} allocation sites at {largest["size"] / 1024:.1f} KiB:']
+    for stat in snapshot.statistics('lineno')[:top]:
+        lines.append(f'  {stat}')
+    return answer, lines
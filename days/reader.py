@@ -0,0 +1,87 @@
+import mmap
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+
+RELEASE_BYTES = 4 * 1024 * 1024
+
+CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def lines(file_path: str) -> Iterator[str]:
+    with open(file_path, 'rb') as f:
+        # Empty files can not be mapped.
+        if f.seek(0, 2) == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            released = 0
+            for line in iter(mm.readline, b''):
+                yield line.decode().strip()
+
+                # Pages behind the cursor are released, so the resident memory stays flat on inputs of any size.
+                if hasattr(mmap, 'MADV_DONTNEED') and mm.tell() - released >= RELEASE_BYTES:
+                    mm.madvise(mmap.MADV_DONTNEED, released, RELEASE_BYTES)
+                    released += RELEASE_BYTES
+
+
+def records(file_path: str) -> Iterator[List[str]]:
+    return split_records(lines(file_path))
+
+
+def split_records(lines: Iterable[str]) -> Iterator[List[str]]:
+    record = []
+
+    for line in lines:
+        line = line.strip()
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+
+    if record:
+        yield record
+
+
+def ints(file_path: str) -> Iterator[int]:
+    for line in lines(file_path):
+        if line:
+            yield int(line)
+
+
+def map_chunks(func: Callable[..., Any], file_path: str, separator: bytes = b'\n', chunk_size: int = CHUNK_SIZE,
+               workers: int = None, args: Tuple = ()) -> List[Any]:
+    # Chunks end on a separator, so no line or record is split, and each worker maps the file itself and reads only
+    # its own chunk: the memory is bounded by the chunk size. func gets the bytes of a chunk and args.
+    chunks = [(func, file_path, start, end, args) for start, end in chunk_bounds(file_path, separator, chunk_size)]
+    if len(chunks) <= 1 or workers == 1:
+        return [_map_chunk(*chunk) for chunk in chunks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_map_chunk, *zip(*chunks)))
+
+
+def chunk_bounds(file_path: str, separator: bytes = b'\n', chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    with open(file_path, 'rb') as f:
+        size = f.seek(0, 2)
+        if size == 0:
+            return []
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bounds = [0]
+            while bounds[-1] < size:
+                end = mm.find(separator, bounds[-1] + chunk_size)
+                bounds.append(size if end == -1 else end + len(separator))
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def _map_chunk(func: Callable[..., Any], file_path: str, start: int, end: int, args: Tuple) -> Any:
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+    return func(data, *args)
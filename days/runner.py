@@ -0,0 +1,76 @@
+import importlib
+import inspect
+import os
+
+from types import ModuleType
+from typing import Any, Callable, List
+
+from days import cache, reader
+
+
+DAYS = range(1, 26)
+PARTS = (1, 2)
+
+
+def load_day(day: int) -> ModuleType:
+    if day not in DAYS:
+        raise ValueError(f'Unknown day: {day}. Expected one of 1..{DAYS[-1]}.')
+
+    module = importlib.import_module(f'days.day{day:02d}')
+    cache.install(module)
+    return module
+
+
+def available_parts(day: int) -> List[int]:
+    module = load_day(day)
+    return [part for part in PARTS if hasattr(module, f'solve_part{part}')]
+
+
+def get_solver(day: int, part: int) -> Callable[[Any], Any]:
+    solver = getattr(load_day(day), f'solve_part{part}', None)
+    if solver is None:
+        raise ValueError(f'Day {day:02d} has no part {part}.')
+
+    return solver
+
+
+def solver_sources(day: int) -> List[str]:
+    # The day module and the modules of this package it uses, so a change to a shared helper counts as a change to the
+    # solver as well.
+    module = load_day(day)
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    sources = set()
+
+    for value in vars(module).values():
+        source = value if inspect.ismodule(value) else inspect.getmodule(value)
+        file_path = getattr(source, '__file__', None)
+        if file_path and os.path.dirname(os.path.abspath(file_path)) == package_dir:
+            sources.add(os.path.abspath(file_path))
+
+    sources.discard(os.path.abspath(module.__file__))
+    return [module.__file__] + sorted(sources)
+
+
+def input_path(day: int, file_path: str = None) -> str:
+    return file_path if file_path else os.path.join(os.path.dirname(__file__), 'inputs', f'day{day:02d}.txt')
+
+
+def streamed_reader(day: int, part: int) -> str:
+    return getattr(load_day(day), 'STREAMED_PARTS', {}).get(part)
+
+
+def input_for(day: int, part: int, file_path: str = None) -> Any:
+    streamed = streamed_reader(day, part)
+    if streamed:
+        return getattr(reader, streamed)(input_path(day, file_path))
+
+    return load_day(day).read_input(file_path)
+
+
+def run_part(day: int, part: int, file_path: str = None) -> Any:
+    solver = get_solver(day, part)
+    return solver(input_for(day, part, file_path))
+
+
+def run_tests(day: int) -> None:
+    load_day(day).run_tests()
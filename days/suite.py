@@ -0,0 +1,76 @@
+import os
+import resource
+import sys
+import time
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Tuple
+
+from days import cache, runner
+
+
+PartResult = namedtuple('PartResult', 'day part answer cpu_time wall_time peak_rss cached error')
+
+# Slowest parts go first so the total wall time is bound by the longest job, not by the tail of the queue.
+LONG_RUNNING = [(15, 2), (23, 2), (22, 2), (20, 2)]
+
+
+def schedule(jobs: List[Tuple[int, int]] = None) -> List[Tuple[int, int]]:
+    jobs = jobs if jobs else [(day, part) for day in runner.DAYS for part in runner.available_parts(day)]
+    return [job for job in LONG_RUNNING if job in jobs] + [job for job in jobs if job not in LONG_RUNNING]
+
+
+def run_all(workers: int = None, cache_dir: str = None, jobs: List[Tuple[int, int]] = None) -> Dict[str, Any]:
+    jobs = schedule(jobs)
+    workers = workers if workers else os.cpu_count()
+    start = time.perf_counter()
+
+    # One task per child keeps ru_maxrss of a worker equal to the peak of the single part it ran.
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as executor:
+        futures = {executor.submit(measure_part, day, part, cache_dir=cache_dir): (day, part) for day, part in jobs}
+        results = []
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                day, part = futures[future]
+                results.append(PartResult(day, part, None, None, None, None, False, f'{type(e).__name__}: {e}'))
+
+    return {
+        'workers': workers,
+        'wall_time': time.perf_counter() - start,
+        'results': [result._asdict() for result in sorted(results, key=lambda r: (r.day, r.part))],
+    }
+
+
+def measure_part(day: int, part: int, file_path: str = None, cache_dir: str = None) -> PartResult:
+    if cache_dir:
+        cache.enable(cache_dir)
+
+    # Answers are stored by the hashes of the input, the day module and the modules it uses, so any change to them
+    # reruns the part. Hashing reads the whole input, so nothing is hashed while the store is disabled, and streamed
+    # parts, which may stop early, always run.
+    key = None
+    if cache.results_enabled() and not runner.streamed_reader(day, part):
+        key = cache.result_key(day, part, runner.input_path(day, file_path), runner.solver_sources(day))
+    stored = cache.load_result(key) if key else None
+    if stored:
+        return PartResult(day, part, stored['answer'], stored['cpu_time'], stored['wall_time'], stored['peak_rss'],
+                          True, None)
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    answer = runner.run_part(day, part, file_path=file_path)
+    cpu_time, wall_time = time.process_time() - cpu_start, time.perf_counter() - wall_start
+
+    result = PartResult(day, part, answer, cpu_time, wall_time, peak_rss(), False, None)
+    if key:
+        cache.store_result(key, {'answer': answer, 'cpu_time': cpu_time, 'wall_time': wall_time,
+                                 'peak_rss': result.peak_rss})
+    return result
+
+
+def peak_rss() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux.
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024